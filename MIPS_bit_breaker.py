@@ -4,6 +4,10 @@ MIPS Instruction Decoder - Enhanced Bit Breaker
 Automatically detects instruction types and provides comprehensive decoding
 """
 
+import sys
+
+import instrumentation
+
 # Test instructions
 b1 = "00000010010100110100000000100000"  # R-Type ADD
 b2 = "10001101001010000000010010110000"  # LW
@@ -165,65 +169,106 @@ def generate_assembly(inst_type, bit_segments, field_names):
 def print_mips_decoding(binary_str):
     """Main function to decode and display MIPS instruction"""
     
-    # Auto-detect instruction type and get field information
-    inst_type, sizes, field_names = detect_instruction_type(binary_str)
-    bit_segments = bit_breaker(sizes, binary_str)
+    with instrumentation.timer("decode"):
+        # Auto-detect instruction type and get field information
+        inst_type, sizes, field_names = detect_instruction_type(binary_str)
+        bit_segments = bit_breaker(sizes, binary_str)
     
-    # Get instruction details
-    if inst_type == "R-Type":
-        operation, description, control_signals = get_instruction_info(bit_segments[0], bit_segments[5])
-    else:
-        operation, description, control_signals = get_instruction_info(bit_segments[0])
+        # Get instruction details
+        if inst_type == "R-Type":
+            operation, description, control_signals = get_instruction_info(bit_segments[0], bit_segments[5])
+        else:
+            operation, description, control_signals = get_instruction_info(bit_segments[0])
     
-    # Generate assembly
-    assembly = generate_assembly(inst_type, bit_segments, field_names)
+        # Generate assembly
+        assembly = generate_assembly(inst_type, bit_segments, field_names)
     
-    # Pretty print results
-    print("╔" + "═" * 70 + "╗")
-    print(f"║ MIPS Instruction Decoder - {inst_type:<45} ")
-    print("╠" + "═" * 70 + "╣")
-    print(f"║ Binary: {binary_str:<55} ")
-    print(f"║ Hex:    0x{int(binary_str, 2):08X}{' ' * 47} ")
-    print("╠" + "═" * 70 + "╣")
+    instrumentation.count("instructions decoded")
     
-    # Field breakdown
-    print("║ Field Breakdown:" + " " * 52 + "")
-    for i, (field, segment, size) in enumerate(zip(field_names, bit_segments, sizes)):
-        decimal_val = int(segment, 2)
-        if field in ["rs", "rt", "rd"] and segment in registers:
-            reg_name = registers[segment]
-            print(f"║   {field:<8} ({size:2}b): {segment} = {decimal_val:3} = {reg_name:<12} ")
-        else:
-            print(f"║   {field:<8} ({size:2}b): {segment} = {decimal_val:<15} ")
+    with instrumentation.timer("output"):
+        # Pretty print results
+        print("╔" + "═" * 70 + "╗")
+        print(f"║ MIPS Instruction Decoder - {inst_type:<45} ")
+        print("╠" + "═" * 70 + "╣")
+        print(f"║ Binary: {binary_str:<55} ")
+        print(f"║ Hex:    0x{int(binary_str, 2):08X}{' ' * 47} ")
+        print("╠" + "═" * 70 + "╣")
     
-    print("╠" + "═" * 70 + "╣")
-    print(f"║ Operation: {operation} - {description:<47} ")
-    print(f"║ Assembly:  {assembly:<55} ")
+        # Field breakdown
+        print("║ Field Breakdown:" + " " * 52 + "")
+        for i, (field, segment, size) in enumerate(zip(field_names, bit_segments, sizes)):
+            decimal_val = int(segment, 2)
+            if field in ["rs", "rt", "rd"] and segment in registers:
+                reg_name = registers[segment]
+                print(f"║   {field:<8} ({size:2}b): {segment} = {decimal_val:3} = {reg_name:<12} ")
+            else:
+                print(f"║   {field:<8} ({size:2}b): {segment} = {decimal_val:<15} ")
     
-    if control_signals:
         print("╠" + "═" * 70 + "╣")
-        print("║ Control Signals:" + " " * 52 + "")
-        # Split control signals into two columns for better formatting
-        signals = list(control_signals.items())
-        for i in range(0, len(signals), 2):
-            left = f"{signals[i][0]}: {signals[i][1]}"
-            right = f"{signals[i+1][0]}: {signals[i+1][1]}" if i+1 < len(signals) else ""
-            print(f"║   {left:<32} {right:<32} ")
+        print(f"║ Operation: {operation} - {description:<47} ")
+        print(f"║ Assembly:  {assembly:<55} ")
     
-    print("╚" + "═" * 70 + "╝")
-    print()
+        if control_signals:
+            print("╠" + "═" * 70 + "╣")
+            print("║ Control Signals:" + " " * 52 + "")
+            # Split control signals into two columns for better formatting
+            signals = list(control_signals.items())
+            for i in range(0, len(signals), 2):
+                left = f"{signals[i][0]}: {signals[i][1]}"
+                right = f"{signals[i+1][0]}: {signals[i+1][1]}" if i+1 < len(signals) else ""
+                print(f"║   {left:<32} {right:<32} ")
+    
+        print("╚" + "═" * 70 + "╝")
+        print()
+
+def parse_instruction(text):
+    """
+    Accept a 32-digit binary string or a '0x'-prefixed hex word and return the
+    32-bit binary string, raising ValueError for anything that isn't one word
+    """
+    text = text.strip().replace("_", "")
+    if text.lower().startswith("0x"):
+        try:
+            word = int(text, 16)
+        except ValueError:
+            raise ValueError(f"'{text}' is not a valid hex instruction")
+        if word >= 1 << 32:
+            raise ValueError(f"'{text}' does not fit in a 32-bit instruction word")
+        return format(word, "032b")
+    if not text or set(text) - {"0", "1"}:
+        raise ValueError(f"'{text}' is not a binary or 0x-prefixed hex instruction")
+    if len(text) != 32:
+        raise ValueError(f"'{text}' has {len(text)} bits, expected 32")
+    return text
+
+def main(args=None):
+    """
+    Main execution function
+
+    Decodes the instructions given on the command line (binary strings or
+    0x-prefixed hex words), or the built-in test instructions when none are given.
+    """
+    args = sys.argv[1:] if args is None else args
+    if args and args[0] in ("-h", "--help"):
+        print("Usage: python MIPS_bit_breaker.py [instruction ...]")
+        print("Example: python MIPS_bit_breaker.py 00000010010100110100000000100000 0x8D2804B0")
+        print("Add --profile to time decoding and output")
+        return 0
+
+    try:
+        instructions = [parse_instruction(arg) for arg in args] or [b1, b2, b3, b4, b5, b6, b7, b8, b9, b10]
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
 
-def main():
-    """Main execution function"""
     print("🔧 MIPS Instruction Decoder - Enhanced Bit Breaker")
     print("=" * 72)
     print()
     
-    instructions = [b1, b2, b3, b4, b5, b6, b7, b8, b9, b10]
-    
     for i, instruction in enumerate(instructions, 1):
         print(f"Instruction {i}:")
         print_mips_decoding(instruction)
+    return 0
 
 if __name__ == "__main__":
-    main()
+    sys.exit(instrumentation.run_main(main))
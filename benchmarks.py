@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+"""
+Benchmarks - times every utility on synthetic workloads, records the results
+as JSON and compares them against a stored baseline
+
+Workloads are generated from a fixed seed, so two runs at the same --scale
+time exactly the same work and can be compared.
+"""
+
+import contextlib
+import json
+import math
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+import instrumentation
+
+DEFAULT_THRESHOLD = 0.10  # Slowdown (fraction of the baseline time) that counts as a regression
+DEFAULT_REPEAT = 3
+
+# --- Synthetic workloads ---
+
+def make_directory_tree(root, depth=4, width=5, files_per_dir=8):
+    """
+    Create a tree 'depth' levels deep where every directory has 'width'
+    subdirectories and 'files_per_dir' empty files.
+
+    Returns:
+        int: Number of entries (files and directories) created below root
+    """
+    entries = 0
+    level = [root]
+    for current_depth in range(depth + 1):
+        next_level = []
+        for directory in level:
+            for i in range(files_per_dir):
+                open(os.path.join(directory, f"file_{i:03}.txt"), "w").close()
+            entries += files_per_dir
+            if current_depth < depth:
+                for i in range(width):
+                    child = os.path.join(directory, f"dir_{i:03}")
+                    os.mkdir(child)
+                    next_level.append(child)
+                entries += width
+        level = next_level
+    return entries
+
+# (opcode, funct) pairs the decoder knows, weighted roughly like real code
+_INSTRUCTION_MIX = (
+    [("000000", "100000")] * 6 + [("000000", "100010")] * 2 +
+    [("000000", funct) for funct in ("100100", "100101", "101010", "000000", "000010", "001000")] +
+    [("100011", None)] * 5 + [("101011", None)] * 3 + [("000100", None)] * 2 +
+    [("000101", None)] * 2 + [("001000", None)] * 4 + [("001100", None),
+    ("000010", None), ("000011", None)]
+)
+
+def make_instruction_stream(count, seed=0):
+    """
+    Random 32-bit MIPS instruction words as binary strings, drawn from the
+    opcodes and R-type functions the decoder supports.
+    """
+    rng = random.Random(seed)
+    stream = []
+    for _ in range(count):
+        opcode, funct = rng.choice(_INSTRUCTION_MIX)
+        if funct is not None:
+            rest = format(rng.getrandbits(20), "020b") + funct
+        else:
+            rest = format(rng.getrandbits(26), "026b")
+        stream.append(opcode + rest)
+    return stream
+
+def make_chapter_pdf(path, pages=2000, chapters=40, seed=0):
+    """
+    Write a text PDF of 'pages' pages in which 'chapters' pages start with a
+    'CHAPTER n' line on its own, the pattern split_by_chapters looks for.
+    Needs PyMuPDF.
+
+    Returns:
+        int: Number of chapter header pages
+    """
+    import fitz
+
+    rng = random.Random(seed)
+    words = ("network", "packet", "router", "switch", "protocol", "frame", "address",
+             "latency", "bandwidth", "segment", "cable", "chapter", "layer", "host")
+    starts = set(rng.sample(range(pages), min(chapters, pages)))
+    chapter = 0
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page()
+        lines = []
+        if i in starts:
+            chapter += 1
+            lines.append(f"CHAPTER {chapter}")
+        # Body text mentions 'chapter' mid-line, which must not match
+        lines += [" ".join(rng.choice(words) for _ in range(12)) for _ in range(30)]
+        page.insert_text((72, 72), "\n".join(lines), fontsize=9)
+    doc.save(path)
+    doc.close()
+    return len(starts)
+
+def make_url_list(count, seed=0):
+    """Distinct URLs of varying length, so QR versions vary too"""
+    rng = random.Random(seed)
+    hosts = ("example.com", "www.example.org", "shop.example.net", "docs.example.io")
+    urls = []
+    for i in range(count):
+        path = "/".join(f"{rng.getrandbits(24):x}" for _ in range(rng.randint(1, 6)))
+        urls.append(f"https://{rng.choice(hosts)}/{path}?id={i}")
+    return urls
+
+def make_triangles(count, seed=0):
+    """
+    Random solvable triangles as solve_triangle input dicts, cycling through
+    the SSS, SAS, ASA, AAS and SSA cases.
+    """
+    rng = random.Random(seed)
+    known_sets = (("a", "b", "c"), ("a", "b", "C"), ("A", "B", "c"),
+                  ("A", "B", "a"), ("a", "b", "A"))
+    triangles = []
+    for i in range(count):
+        A = rng.uniform(10, 150)
+        B = rng.uniform(5, 170 - A)
+        C = 180 - A - B
+        scale = rng.uniform(1, 100) / math.sin(math.radians(A))
+        full = {"A": A, "B": B, "C": C, "a": scale * math.sin(math.radians(A)),
+                "b": scale * math.sin(math.radians(B)), "c": scale * math.sin(math.radians(C))}
+        known = known_sets[i % len(known_sets)]
+        triangles.append({key: (value if key in known else None) for key, value in full.items()})
+    return triangles
+
+# --- Benchmarks ---
+# Each takes (workdir, scale), builds its workload untimed and returns
+# (run, units, unit name); run() is what gets timed, once per repeat
+
+@contextlib.contextmanager
+def _quiet(workdir=None):
+    """Silence stdout and optionally run inside workdir"""
+    previous = os.getcwd()
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        if workdir:
+            os.chdir(workdir)
+        try:
+            yield
+        finally:
+            os.chdir(previous)
+
+def _reuse_or_build(path, build):
+    """
+    Return path, first calling build(tmp_path) to create it if it doesn't
+    exist yet. The workload is built under a temporary name and renamed into
+    place, so an interrupted build is never mistaken for a finished one and
+    a kept --workdir skips the generation on later runs.
+    """
+    if not os.path.exists(path):
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        if os.path.isdir(tmp_path):
+            shutil.rmtree(tmp_path)
+        build(tmp_path)
+        os.replace(tmp_path, path)
+    return path
+
+def _build_tree(root, files_per_dir):
+    os.mkdir(root)
+    make_directory_tree(root, files_per_dir=files_per_dir)
+
+def bench_tree(workdir, scale):
+    import tree_logger
+
+    # The workload's size is in its name, so a kept workdir run at another
+    # scale builds a new tree instead of timing the old one
+    files_per_dir = max(1, round(8 * scale))
+    root = _reuse_or_build(os.path.join(workdir, f"tree_{files_per_dir}"),
+                           lambda path: _build_tree(path, files_per_dir))
+    entries = sum(len(dirs) + len(files) for _, dirs, files in os.walk(root))
+
+    def run():
+        with _quiet(), open(os.path.join(workdir, "tree_log.txt"), "w", encoding="utf-8") as log:
+            tree_logger.print_directory_tree(root, log_file=log)
+
+    return run, entries, "entries"
+
+def bench_mips(workdir, scale):
+    import MIPS_bit_breaker
+
+    stream = make_instruction_stream(max(1, round(20000 * scale)))
+
+    def run():
+        with _quiet():
+            for word in stream:
+                MIPS_bit_breaker.print_mips_decoding(word)
+
+    return run, len(stream), "instructions"
+
+def bench_pdf(workdir, scale):
+    import pdf_chapter_splitter
+
+    pages = max(10, round(2000 * scale))
+    path = _reuse_or_build(os.path.join(workdir, f"book_{pages}.pdf"),
+                           lambda path: make_chapter_pdf(path, pages=pages,
+                                                         chapters=max(1, pages // 50)))
+    out_dir = os.path.join(workdir, "chapters")
+    os.makedirs(out_dir, exist_ok=True)
+
+    def run():
+        # split_by_chapters writes chapter_N.pdf into the working directory
+        with _quiet(out_dir):
+            pdf_chapter_splitter.split_by_chapters(path, verbose=False)
+
+    return run, pages, "pages"
+
+def bench_qr(workdir, scale):
+    # qr_code_generator imports these lazily, on the first encode; import them
+    # here so a missing one skips the benchmark instead of failing inside run()
+    import qrcode  # noqa: F401
+    import PIL  # noqa: F401
+    import qr_code_generator
+
+    urls = make_url_list(max(1, round(200 * scale)))
+    out_dir = os.path.join(workdir, "qr")
+    os.makedirs(out_dir, exist_ok=True)
+
+    def run():
+        # Start cold each time so the matrix cache doesn't turn repeats into lookups
+        qr_code_generator.matrix_cache.clear()
+        for i, url in enumerate(urls):
+            qr_code_generator.generate_qr_code(url, os.path.join(out_dir, f"{i}.png"), verbose=False)
+
+    return run, len(urls), "codes"
+
+def bench_triangle(workdir, scale):
+    import trig_triangle_helper
+
+    triangles = make_triangles(max(1, round(20000 * scale)))
+
+    def run():
+        for values in triangles:
+            trig_triangle_helper.solve_triangle(values, with_steps=False)
+
+    return run, len(triangles), "triangles"
+
+def bench_triangle_batch(workdir, scale):
+    import numpy  # noqa: F401 - skip cleanly without NumPy
+    import trig_triangle_helper
+
+    triangles = make_triangles(max(1, round(200000 * scale)))
+    nan = float("nan")
+    columns = [[nan if t[key] is None else t[key] for t in triangles]
+               for key in trig_triangle_helper.TRIANGLE_COLUMNS]
+
+    def run():
+        trig_triangle_helper.solve_triangles(*columns)
+
+    return run, len(triangles), "triangles"
+
+BENCHMARKS = {
+    "tree": bench_tree,
+    "mips": bench_mips,
+    "pdf": bench_pdf,
+    "qr": bench_qr,
+    "triangle": bench_triangle,
+    "triangle-batch": bench_triangle_batch,
+}
+
+def run_benchmarks(names=None, scale=1.0, repeat=DEFAULT_REPEAT, workdir=None, verbose=True):
+    """
+    Build each workload and time it 'repeat' times.
+
+    Benchmarks whose optional dependency (PyMuPDF, qrcode, NumPy) is missing
+    are recorded as skipped rather than failing the run.
+
+    Args:
+        names (list): Benchmarks to run (default: all of BENCHMARKS)
+        scale (float): Multiplier on every workload's size
+        repeat (int): Timed runs per benchmark; the fastest is the result
+        workdir (str): Directory for generated files (default: a temporary one)
+        verbose (bool): Print one line per benchmark
+
+    Returns:
+        dict: 'environment', 'scale', 'repeat' and 'results', where each
+              result has 'seconds' (best), 'median', 'units', 'unit' and
+              'rate' (units per second), or 'skipped' with the reason
+    """
+    names = list(BENCHMARKS) if names is None else names
+    results = {}
+    with contextlib.ExitStack() as stack:
+        if workdir is None:
+            workdir = stack.enter_context(tempfile.TemporaryDirectory(prefix="quickbits-bench-"))
+        for name in names:
+            bench_dir = os.path.join(workdir, name)
+            os.makedirs(bench_dir, exist_ok=True)
+            try:
+                run, units, unit = BENCHMARKS[name](bench_dir, scale)
+            except ImportError as e:
+                results[name] = {"skipped": f"missing dependency: {e.name or e}"}
+                if verbose:
+                    print(f"{name:<15} skipped ({results[name]['skipped']})")
+                continue
+
+            times = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                run()
+                times.append(time.perf_counter() - start)
+            best = min(times)
+            results[name] = {"seconds": best, "median": statistics.median(times),
+                             "units": units, "unit": unit,
+                             "rate": units / best if best > 0 else float("inf")}
+            if verbose:
+                print(f"{name:<15} {best * 1000:10.1f}ms  {results[name]['rate']:>12,.0f} {unit}/s")
+
+    return {
+        "environment": {"python": platform.python_version(), "implementation": platform.python_implementation(),
+                        "platform": platform.platform(), "machine": platform.machine()},
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "scale": scale,
+        "repeat": repeat,
+        "results": results,
+    }
+
+def compare_results(current, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare a run against a baseline run.
+
+    Only benchmarks present and not skipped in both, with the same amount of
+    work, are compared.
+
+    Args:
+        current (dict): Output of run_benchmarks
+        baseline (dict): An earlier output of run_benchmarks
+        threshold (float): Allowed slowdown as a fraction of the baseline time
+
+    Returns:
+        list: Dicts with 'name', 'baseline', 'current' (seconds), 'change'
+              (fractional, positive is slower) and 'regression' (bool)
+    """
+    comparisons = []
+    for name, result in current["results"].items():
+        before = baseline.get("results", {}).get(name)
+        if not before or "seconds" not in before or "seconds" not in result:
+            continue
+        if before["units"] != result["units"]:
+            continue
+        change = result["seconds"] / before["seconds"] - 1 if before["seconds"] > 0 else 0.0
+        comparisons.append({"name": name, "baseline": before["seconds"], "current": result["seconds"],
+                            "change": change, "regression": change > threshold})
+    return comparisons
+
+def main(args=None):
+    """
+    Handle 'python benchmarks.py [options]'
+
+    Options:
+        --only a,b          Benchmarks to run (tree, mips, pdf, qr, triangle, triangle-batch)
+        --scale F           Multiplier on the workload sizes (default: 1.0)
+        --repeat N          Timed runs per benchmark (default: 3)
+        --workdir DIR       Keep generated workloads in DIR and reuse them on later runs
+        --output FILE       Write the results as JSON
+        --baseline FILE     Compare against an earlier --output file
+        --threshold F       Allowed slowdown before failing (default: 0.10 = 10%)
+        --save-baseline     With --baseline, overwrite it with this run when nothing regressed
+    """
+    args = sys.argv[1:] if args is None else args
+    options = {"--only": None, "--scale": 1.0, "--repeat": DEFAULT_REPEAT, "--workdir": None,
+               "--output": None, "--baseline": None, "--threshold": DEFAULT_THRESHOLD}
+    converters = {"--scale": float, "--repeat": int, "--threshold": float}
+    save_baseline = False
+
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg in ("-h", "--help"):
+            print(main.__doc__)
+            return 0
+        if arg == "--save-baseline":
+            save_baseline = True
+            i += 1
+        elif arg in options and i + 1 < len(args):
+            value = args[i + 1]
+            if arg in converters:
+                try:
+                    value = converters[arg](value)
+                except ValueError:
+                    print(f"Error: {arg} expects a number, got '{value}'")
+                    return 1
+            options[arg] = value
+            i += 2
+        else:
+            print(f"Error: Unknown or incomplete option '{arg}'")
+            return 1
+
+    names = options["--only"].split(",") if options["--only"] else None
+    unknown = [name for name in names or [] if name not in BENCHMARKS]
+    if unknown:
+        print(f"Error: Unknown benchmark(s) {', '.join(unknown)}; choose from {', '.join(BENCHMARKS)}")
+        return 1
+    if options["--repeat"] < 1 or options["--scale"] <= 0:
+        print("Error: --repeat and --scale must be positive")
+        return 1
+
+    report = run_benchmarks(names, scale=options["--scale"], repeat=options["--repeat"],
+                            workdir=options["--workdir"])
+
+    if options["--output"]:
+        with open(options["--output"], "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {options['--output']}")
+
+    regressed = False
+    baseline_path = options["--baseline"]
+    if baseline_path and os.path.exists(baseline_path):
+        with open(baseline_path, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("scale") != report["scale"]:
+            print(f"Warning: baseline was recorded at scale {baseline.get('scale')}, "
+                  f"this run used {report['scale']}")
+        print(f"\nCompared with {baseline_path} (threshold {options['--threshold']:.0%}):")
+        for row in compare_results(report, baseline, options["--threshold"]):
+            flag = "REGRESSION" if row["regression"] else "ok"
+            print(f"{row['name']:<15} {row['baseline'] * 1000:10.1f}ms -> {row['current'] * 1000:10.1f}ms "
+                  f"{row['change']:+8.1%}  {flag}")
+            regressed |= row["regression"]
+    elif baseline_path:
+        print(f"No baseline at {baseline_path} yet")
+
+    if baseline_path and save_baseline and not regressed:
+        with open(baseline_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline saved to {baseline_path}")
+    return 1 if regressed else 0
+
+if __name__ == "__main__":
+    sys.exit(instrumentation.run_main(main))
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Instrumentation - named timers and counters shared by the utilities
+
+Tools call timer("name") around hot-path stages and count("name", n) for work
+done. Both do nothing until profiling is switched on with --profile, so the
+calls can stay in the main loops: a disabled timer is a shared no-op context
+manager and a disabled count is a single flag check.
+
+Flags understood by run_main (and so by every tool and quickbits subcommand):
+    --profile                 Print a timer/counter table to stderr at exit
+    --profile=json            Print the same summary as JSON instead
+    --profile-cprofile        Also run cProfile and list the top functions
+    --profile-cprofile=FILE   ...and save the raw stats to FILE (for pstats/snakeviz)
+    --profile-memory          Also trace allocations with tracemalloc
+"""
+
+import sys
+import time
+
+enabled = False
+timers = {}    # name -> [calls, seconds]
+counters = {}  # name -> total
+
+CPROFILE_TOP = 15
+TRACEMALLOC_TOP = 10
+
+class _Timer:
+    """Adds the time spent inside the 'with' block to a named timer"""
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.start
+        entry = timers.get(self.name)
+        if entry is None:
+            timers[self.name] = [1, elapsed]
+        else:
+            entry[0] += 1
+            entry[1] += elapsed
+        return False
+
+class _NullTimer:
+    """What timer() hands out while profiling is off"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+_NULL_TIMER = _NullTimer()
+
+def timer(name):
+    """Context manager timing a named stage (a no-op unless profiling is on)"""
+    return _Timer(name) if enabled else _NULL_TIMER
+
+def count(name, n=1):
+    """Add n to a named counter (a no-op unless profiling is on)"""
+    if enabled:
+        counters[name] = counters.get(name, 0) + n
+
+def reset():
+    """Clear every timer and counter"""
+    timers.clear()
+    counters.clear()
+
+def summary(wall=None):
+    """
+    Return the collected timers and counters.
+
+    Args:
+        wall (float): Total run time in seconds, used for percentages and rates
+
+    Returns:
+        dict: 'wall', 'timers' (name -> calls, seconds, mean) and 'counters'
+              (name -> value, and per_second when wall is known)
+    """
+    return {
+        "wall": wall,
+        "timers": {name: {"calls": calls, "seconds": seconds, "mean": seconds / calls}
+                   for name, (calls, seconds) in sorted(timers.items(), key=lambda t: -t[1][1])},
+        "counters": {name: {"value": value,
+                            "per_second": value / wall if wall else None}
+                     for name, value in sorted(counters.items())},
+    }
+
+def format_table(data):
+    """Render a summary() dict as a plain-text table"""
+    wall = data["wall"]
+    lines = [f"Profile: {wall:.3f}s wall" if wall is not None else "Profile"]
+    if data["timers"]:
+        lines.append(f"  {'timer':<24} {'calls':>9} {'total':>11} {'mean':>11} {'% wall':>7}")
+        for name, t in data["timers"].items():
+            share = f"{t['seconds'] / wall:7.1%}" if wall else f"{'':>7}"
+            lines.append(f"  {name:<24} {t['calls']:>9,} {t['seconds'] * 1000:>9.1f}ms "
+                         f"{t['mean'] * 1000:>9.3f}ms {share}")
+    if data["counters"]:
+        lines.append(f"  {'counter':<24} {'value':>15} {'per second':>15}")
+        for name, c in data["counters"].items():
+            rate = f"{c['per_second']:>15,.0f}" if c["per_second"] is not None else ""
+            lines.append(f"  {name:<24} {c['value']:>15,} {rate}")
+    if not data["timers"] and not data["counters"]:
+        lines.append("  (nothing recorded)")
+    return "\n".join(lines)
+
+def parse_profile_args(args):
+    """
+    Pull the --profile* flags out of an argument list.
+
+    Returns:
+        tuple: (remaining args, options dict or None when profiling is off).
+               The options are 'format' ('table' or 'json'), 'cprofile'
+               (False, True or a file name) and 'memory' (bool)
+    """
+    remaining = []
+    options = None
+    for arg in args:
+        flag, _, value = arg.partition("=")
+        if flag not in ("--profile", "--profile-cprofile", "--profile-memory"):
+            remaining.append(arg)
+            continue
+        if options is None:
+            options = {"format": "table", "cprofile": False, "memory": False}
+        if flag == "--profile" and value:
+            if value not in ("table", "json"):
+                raise ValueError(f"--profile expects 'table' or 'json', got '{value}'")
+            options["format"] = value
+        elif flag == "--profile-cprofile":
+            options["cprofile"] = value or True
+        elif flag == "--profile-memory":
+            options["memory"] = True
+    return remaining, options
+
+def run_main(main, args=None):
+    """
+    Call a tool's main(args), profiling it when the args ask for it.
+
+    The --profile* flags are removed before main sees the arguments. The
+    report goes to stderr so it never mixes with a tool's own output.
+
+    Returns:
+        The value main returned
+    """
+    global enabled
+    args = sys.argv[1:] if args is None else args
+    try:
+        args, options = parse_profile_args(args)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+    if options is None:
+        return main(args)
+
+    profiler = None
+    if options["cprofile"]:
+        import cProfile
+        profiler = cProfile.Profile()
+    if options["memory"]:
+        import tracemalloc
+        tracemalloc.start()
+
+    reset()
+    enabled = True
+    start = time.perf_counter()
+    if profiler is not None:
+        profiler.enable()
+    try:
+        return main(args)
+    finally:
+        if profiler is not None:
+            profiler.disable()
+        wall = time.perf_counter() - start
+        enabled = False
+        _report(summary(wall), options, profiler)
+
+def _report(data, options, profiler):
+    """Write the summary plus any cProfile/tracemalloc results to stderr"""
+    if options["memory"]:
+        import tracemalloc
+        current, peak = tracemalloc.get_traced_memory()
+        top = tracemalloc.take_snapshot().statistics("lineno")[:TRACEMALLOC_TOP]
+        tracemalloc.stop()
+        data["memory"] = {"current": current, "peak": peak,
+                          "top": [{"location": str(stat.traceback), "size": stat.size,
+                                   "count": stat.count} for stat in top]}
+
+    if isinstance(options["cprofile"], str):
+        profiler.dump_stats(options["cprofile"])
+        data["cprofile_file"] = options["cprofile"]
+
+    if options["format"] == "json":
+        import json
+        print(json.dumps(data, indent=2), file=sys.stderr)
+    else:
+        print(file=sys.stderr)
+        print(format_table(data), file=sys.stderr)
+        if "memory" in data:
+            memory = data["memory"]
+            print(f"Memory: {memory['current'] / 1024:,.1f} KiB at exit, "
+                  f"{memory['peak'] / 1024:,.1f} KiB peak", file=sys.stderr)
+            for stat in memory["top"]:
+                print(f"  {stat['size'] / 1024:>10,.1f} KiB {stat['count']:>8,} blocks  "
+                      f"{stat['location']}", file=sys.stderr)
+
+    if profiler is not None and options["format"] != "json":
+        import pstats
+        print(f"\ncProfile: top {CPROFILE_TOP} by cumulative time", file=sys.stderr)
+        pstats.Stats(profiler, stream=sys.stderr).sort_stats("cumulative").print_stats(CPROFILE_TOP)
+    if "cprofile_file" in data:
+        print(f"cProfile stats saved to {data['cprofile_file']}", file=sys.stderr)
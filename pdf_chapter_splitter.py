@@ -1,33 +1,43 @@
+import os
 import re
+import sys
 import fitz  # PyMuPDF
-print(fitz.__doc__)
-print(fitz.__version__)
+
+import instrumentation
 
 def split_by_chapters(pdf_path, skip_first=0, verbose=True):
     """
     Splits a PDF into separate files for each chapter using a specific regex
     that looks for chapter titles at the end of a line.
+
+    Returns True when the chapters were written, False when the PDF couldn't
+    be opened or no chapters were found.
     """
     # This new pattern is the key to the fix.
     # It only matches lines that end after the chapter number.
     chapter_pattern = r"^\s*CHAPTER\s+(\d+|[IVXLCDM]+)\s*$"
 
     try:
-        doc = fitz.open(pdf_path)
+        with instrumentation.timer("open"):
+            doc = fitz.open(pdf_path)
     except Exception as e:
         print(f"Error opening PDF file: {e}")
-        return
+        return False
         
     total_pages = doc.page_count
     chapter_indices = []
 
     for i in range(total_pages):
-        page = doc.load_page(i)
-        # Using get_text("text") is correct. No change needed here.
-        text = page.get_text("text").replace("\xa0", " ")
+        with instrumentation.timer("text extraction"):
+            page = doc.load_page(i)
+            # Using get_text("text") is correct. No change needed here.
+            text = page.get_text("text").replace("\xa0", " ")
+        instrumentation.count("pages extracted")
 
         # This search will now only succeed on the main chapter title pages
-        if re.search(chapter_pattern, text, re.IGNORECASE | re.MULTILINE):
+        with instrumentation.timer("regex"):
+            found = re.search(chapter_pattern, text, re.IGNORECASE | re.MULTILINE)
+        if found:
             chapter_indices.append(i)
             if verbose:
                 print(f"Found chapter start on page {i+1}")
@@ -35,7 +45,7 @@ def split_by_chapters(pdf_path, skip_first=0, verbose=True):
     if not chapter_indices:
         print("No chapters detected. The regex pattern might need adjustment for this PDF's format.")
         doc.close()
-        return
+        return False
 
     chapter_indices.append(total_pages)
     
@@ -47,20 +57,25 @@ def split_by_chapters(pdf_path, skip_first=0, verbose=True):
         start_page = chapter_indices[i]
         end_page = chapter_indices[i+1]
         
-        writer = fitz.open()
-        
-        # Insert the entire page range for the chapter at once
-        writer.insert_pdf(doc, from_page=start_page, to_page=end_page - 1)
-        
-        # Chapter numbers are now correctly identified based on the index
-        filename = f"chapter_{i+1}.pdf"
-        writer.save(filename)
-        writer.close()
+        with instrumentation.timer("write"):
+            writer = fitz.open()
+            
+            # Insert the entire page range for the chapter at once
+            writer.insert_pdf(doc, from_page=start_page, to_page=end_page - 1)
+            
+            # Chapter numbers are now correctly identified based on the index
+            filename = f"chapter_{i+1}.pdf"
+            writer.save(filename)
+            writer.close()
+        instrumentation.count("chapters written")
+        if instrumentation.enabled:
+            instrumentation.count("bytes written", os.path.getsize(filename))
         
         if verbose:
             print(f"✅ Saved {filename} (pages {start_page + 1} to {end_page})")
             
     doc.close()
+    return True
 
 def merge_chapter_pairs(chapter_tuples, prefix="chapter", output_prefix="merged", verbose=True):
     """
@@ -88,4 +103,55 @@ def merge_chapter_pairs(chapter_tuples, prefix="chapter", output_prefix="merged"
         if verbose:
             print(f"Merged {file1} + {file2} -> {out_filename}")
 
-split_by_chapters('/Users/simondunk/Downloads/Guide_To_Networking_Essentials.pdf', skip_first=12)
+def main(args=None):
+    """
+    Handle 'python pdf_chapter_splitter.py <book.pdf> [--skip-first N] [--quiet]'
+    and 'python pdf_chapter_splitter.py --merge 1,2 3,4 ...'
+    """
+    args = sys.argv[1:] if args is None else args
+    if not args or args[0] in ("-h", "--help"):
+        print("Usage: python pdf_chapter_splitter.py <book.pdf> [--skip-first N] [--quiet]")
+        print("       python pdf_chapter_splitter.py --merge 1,2 [3,4 ...]")
+        print("Add --profile to time text extraction, regex and writing")
+        print(f"PyMuPDF {fitz.__version__}")
+        return 0 if args else 1
+
+    verbose = "--quiet" not in args
+    if args[0] == "--merge":
+        try:
+            pairs = [tuple(int(n) for n in pair.split(",")) for pair in args[1:] if pair != "--quiet"]
+        except ValueError:
+            pairs = []
+        if not pairs or any(len(pair) != 2 for pair in pairs):
+            print("Error: --merge expects chapter pairs such as 1,2 3,4")
+            return 1
+        merge_chapter_pairs(pairs, verbose=verbose)
+        return 0
+
+    pdf_path = None
+    skip_first = 0
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg == "--skip-first":
+            try:
+                skip_first = int(args[i + 1])
+            except (IndexError, ValueError):
+                print("Error: --skip-first expects an integer")
+                return 1
+            i += 2
+            continue
+        if arg.startswith("--") and arg != "--quiet":
+            print(f"Error: Unknown option '{arg}'")
+            return 1
+        if arg != "--quiet" and pdf_path is None:
+            pdf_path = arg
+        i += 1
+    if pdf_path is None:
+        print("Error: No PDF file given")
+        return 1
+
+    return 0 if split_by_chapters(pdf_path, skip_first=skip_first, verbose=verbose) else 1
+
+if __name__ == "__main__":
+    sys.exit(instrumentation.run_main(main))
@@ -1,9 +1,315 @@
-import qrcode
-from PIL import Image
 import sys
 import os
+import csv
+import json
+import time
+import hashlib
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
 
-def generate_qr_code(url, filename=None, size=10, border=4):
+import instrumentation
+
+# qrcode, PIL and NumPy are imported on first use. qrcode is imported without
+# PIL (see _load_qrcode), so SVG and terminal output never load PIL or NumPy,
+# and only need qrcode on a cache miss
+np = None
+
+# Same value as qrcode.constants.ERROR_CORRECT_L, kept here so default
+# arguments don't force the qrcode import
+ERROR_CORRECT_L = 1
+
+# Output formats generate_qr_code can write, by file extension
+OUTPUT_FORMATS = {"png": ".png", "svg": ".svg"}
+
+def _load_qrcode():
+    """
+    Import qrcode the first time a matrix has to be encoded, keeping PIL out.
+
+    qrcode itself only needs PIL for drawing, but importing it loads PIL for
+    its optional styled drawers when PIL is installed, which costs more than
+    the encoding. PIL is hidden while qrcode imports (the drawers are skipped,
+    as when PIL is missing), and PNG output imports it later when it draws.
+    """
+    if "qrcode" in sys.modules:
+        return sys.modules["qrcode"]
+    hide_pil = "PIL" not in sys.modules
+    if hide_pil:
+        sys.modules["PIL"] = None  # Makes 'import PIL' raise ImportError
+    try:
+        import qrcode
+    finally:
+        if hide_pil and sys.modules.get("PIL", False) is None:
+            del sys.modules["PIL"]
+    return qrcode
+
+def _load_numpy():
+    """
+    Import NumPy the first time it's needed.
+
+    NumPy is optional: with it, images are rasterized directly from the module
+    matrix; without it, we fall back to qrcode's own PIL drawing.
+    """
+    global np
+    if np is None:
+        try:
+            import numpy
+            np = numpy
+        except ImportError:
+            np = False
+    return np or None
+
+# Above roughly this many output pixels the rasterizer becomes memory-bound and
+# qrcode's own filled-rectangle drawing is as fast or faster (see
+# benchmark_rendering), so large renders keep drawing box by box
+RASTERIZE_MAX_PIXELS = 2_000_000
+
+class MatrixCache:
+    """
+    LRU cache of encoded QR module matrices, keyed by (data, error_correction).
+
+    Encoding (version fitting and mask evaluation) doesn't depend on box size or
+    border, so a cached matrix can be rendered at any size without re-encoding.
+    With cache_dir set, matrices are also stored on disk as small JSON files so
+    separate processes and later runs share them.
+    """
+
+    def __init__(self, maxsize=1024, cache_dir=None):
+        """
+        Args:
+            maxsize (int): Matrices kept in memory before evicting the least
+                           recently used one (0 disables the memory layer)
+            cache_dir (str): Directory for the on-disk store (optional)
+        """
+        self.maxsize = maxsize
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def _disk_path(self, key):
+        digest = hashlib.sha256(f"{key[1]}:{key[0]}".encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.json")
+
+    def get(self, data, error_correction):
+        """Return the cached module matrix, or None if it isn't cached"""
+        key = (data, error_correction)
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+        if self.cache_dir:
+            try:
+                with open(self._disk_path(key), "r", encoding="utf-8") as f:
+                    record = json.load(f)
+                # The file name is a hash, so confirm it's really this payload
+                if record["data"] == data and record["error_correction"] == error_correction:
+                    modules = tuple(tuple(c == "1" for c in row) for row in record["modules"])
+                    self._remember(key, modules)
+                    self.disk_hits += 1
+                    return modules
+            except (OSError, ValueError, KeyError):
+                pass
+
+        self.misses += 1
+        return None
+
+    def put(self, data, error_correction, modules):
+        """Store a module matrix in memory and, if enabled, on disk"""
+        key = (data, error_correction)
+        modules = tuple(tuple(bool(c) for c in row) for row in modules)
+        self._remember(key, modules)
+
+        if self.cache_dir:
+            record = {
+                "data": data,
+                "error_correction": error_correction,
+                "modules": ["".join("1" if c else "0" for c in row) for row in modules],
+            }
+            path = self._disk_path(key)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(record, f)
+                os.replace(tmp_path, path)
+            except OSError:
+                pass  # The disk store is only an optimization
+        return modules
+
+    def _remember(self, key, modules):
+        if self.maxsize <= 0:
+            return
+        self._entries[key] = modules
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop the in-memory entries and reset the statistics"""
+        self._entries.clear()
+        self.hits = self.disk_hits = self.misses = 0
+
+    def stats(self):
+        """Return hit/miss counts, the hit rate and the number of cached entries"""
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+        }
+
+# Shared by every generate_qr_code call in this process
+matrix_cache = MatrixCache()
+
+def configure_matrix_cache(maxsize=1024, cache_dir=None):
+    """Replace the process-wide matrix cache, e.g. to add an on-disk store"""
+    global matrix_cache
+    matrix_cache = MatrixCache(maxsize, cache_dir)
+    return matrix_cache
+
+def encode_modules(data, error_correction=ERROR_CORRECT_L, cache=None):
+    """
+    Encode data into a QR module matrix (without border), using the cache.
+
+    Args:
+        data (str): The data to encode
+        error_correction (int): One of the qrcode.constants.ERROR_CORRECT_* levels
+        cache (MatrixCache): Cache to use (default: the process-wide one)
+
+    Returns:
+        tuple: Rows of booleans, True for dark modules
+    """
+    cache = cache if cache is not None else matrix_cache
+    modules = cache.get(data, error_correction)
+    if modules is not None:
+        return modules
+
+    qrcode = _load_qrcode()
+    qr = qrcode.QRCode(
+        version=1,  # Controls the size of the QR code (1-40)
+        error_correction=error_correction,
+        border=0,
+    )
+    qr.add_data(data)
+    qr.make(fit=True)
+    return cache.put(data, error_correction, qr.modules)
+
+def add_border(modules, border):
+    """Surround a module matrix with a light border, like qr.get_matrix() does"""
+    if not border:
+        return modules
+    width = len(modules) + border * 2
+    blank = (False,) * border
+    rows = [(False,) * width] * border
+    rows += [blank + tuple(row) + blank for row in modules]
+    rows += [(False,) * width] * border
+    return rows
+
+def draw_modules(modules, box_size, border):
+    """
+    Draw a module matrix box by box with qrcode's PIL image factory.
+
+    This mirrors qr.make_image() for a matrix that came from the cache, so no
+    QRCode instance (and no re-encoding) is needed.
+    """
+    from qrcode.image.pil import PilImage
+
+    image = PilImage(border, len(modules), box_size, qrcode_modules=modules,
+                     fill_color="black", back_color="white")
+    for r, row in enumerate(modules):
+        for c, dark in enumerate(row):
+            if dark:
+                image.drawrect(r, c)
+    return image
+
+def render_image(modules, size=10, border=4):
+    """
+    Render a module matrix (without border) as a black-and-white PIL image.
+
+    Uses the NumPy rasterizer when available and the image is small enough for
+    it to win, otherwise draws box by box like qr.make_image().
+    """
+    if _load_numpy() and ((len(modules) + 2 * border) * size) ** 2 <= RASTERIZE_MAX_PIXELS:
+        return rasterize_matrix(add_border(modules, border), size)
+    return draw_modules(modules, size, border)
+
+def render_svg(modules, size=10, border=4):
+    """
+    Render a module matrix (without border) as an SVG document.
+
+    Each horizontal run of dark modules becomes one stroked segment, one module
+    thick, in a single <path>. Coordinates are in module units and scaled by
+    the viewBox, so the file stays small and needs neither PIL nor NumPy.
+
+    Args:
+        modules (tuple): Rows of booleans (True = dark), as from encode_modules
+        size (int): Size of each box in pixels (sets the width/height)
+        border (int): Border size in boxes
+
+    Returns:
+        str: The SVG markup
+    """
+    segments = []
+    for y, row in enumerate(modules, border):
+        x = 0
+        count = len(row)
+        while x < count:
+            if not row[x]:
+                x += 1
+                continue
+            start = x
+            while x < count and row[x]:
+                x += 1
+            # The stroke is centered on the line, so draw through the row's middle
+            segments.append(f"M{start + border} {y}.5h{x - start}")
+
+    width = len(modules) + 2 * border
+    pixels = width * size
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{pixels}" height="{pixels}" '
+        f'viewBox="0 0 {width} {width}" shape-rendering="crispEdges">\n'
+        f'<rect width="{width}" height="{width}" fill="#fff"/>\n'
+        f'<path stroke="#000" d="{"".join(segments)}"/>\n'
+        '</svg>\n'
+    )
+
+def render_terminal(modules, border=2, dark_background=True):
+    """
+    Render a module matrix (without border) as Unicode half-block text.
+
+    Each character cell holds two module rows (upper and lower half blocks), so
+    the code keeps its square shape in a terminal. On a dark background the
+    light modules are the ones drawn, so the code reads as dark-on-light.
+
+    Args:
+        modules (tuple): Rows of booleans (True = dark), as from encode_modules
+        border (int): Border size in modules (scanners need some quiet zone)
+        dark_background (bool): Draw light modules instead of dark ones
+
+    Returns:
+        str: The text, one line per pair of module rows
+    """
+    # A module is drawn when it's light on a dark background, or dark otherwise
+    drawn = [[dark != dark_background for dark in row] for row in add_border(modules, border)]
+    if len(drawn) % 2:
+        drawn.append([False] * len(drawn[0]))  # Odd height: leave the lower half empty
+
+    # Index by (upper half drawn, lower half drawn)
+    blocks = {(False, False): " ", (True, False): "\u2580",
+              (False, True): "\u2584", (True, True): "\u2588"}
+    lines = []
+    for upper, lower in zip(drawn[0::2], drawn[1::2]):
+        lines.append("".join(blocks[pair] for pair in zip(upper, lower)))
+    return "\n".join(lines)
+
+def generate_qr_code(url, filename=None, size=10, border=4, verbose=True,
+                     error_correction=ERROR_CORRECT_L, output_format=None):
     """
     Generate a QR code for a given URL
     
@@ -12,51 +318,480 @@ def generate_qr_code(url, filename=None, size=10, border=4):
         filename (str): Output filename (optional)
         size (int): Size of each box in pixels
         border (int): Border size in boxes
+        verbose (bool): Print a message once the file is saved
+        error_correction (int): One of the qrcode.constants.ERROR_CORRECT_* levels
+        output_format (str): 'png' or 'svg' (default: from the filename's
+                             extension, falling back to 'png')
     """
     
-    # Create QR code instance
-    qr = qrcode.QRCode(
-        version=1,  # Controls the size of the QR code (1-40)
-        error_correction=qrcode.constants.ERROR_CORRECT_L,  # Error correction level
-        box_size=size,  # Size of each box in pixels
-        border=border,  # Border size in boxes
-    )
+    if output_format is None:
+        output_format = "svg" if filename and filename.lower().endswith(".svg") else "png"
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported output format '{output_format}'")
+    extension = OUTPUT_FORMATS[output_format]
     
-    # Add data to the QR code
-    qr.add_data(url)
-    qr.make(fit=True)
-    
-    # Create QR code image
-    qr_image = qr.make_image(fill_color="black", back_color="white")
+    # Encode the URL, reusing the matrix if this payload was seen before
+    with instrumentation.timer("encode"):
+        modules = encode_modules(url, error_correction)
     
     # Generate filename if not provided
     if filename is None:
         # Extract domain name for filename
         domain = url.replace("https://", "").replace("http://", "").replace("www.", "")
         domain = domain.split("/")[0].replace(".", "_")
-        filename = f"qr_code_{domain}.png"
+        filename = f"qr_code_{domain}{extension}"
     
-    # Ensure filename has .png extension
-    if not filename.lower().endswith('.png'):
-        filename += '.png'
+    # Ensure filename has the right extension
+    if not filename.lower().endswith(extension):
+        filename += extension
     
-    # Save the image
-    qr_image.save(filename)
-    print(f"QR code generated successfully: {filename}")
+    # Render and save the code
+    if output_format == "svg":
+        with instrumentation.timer("render"):
+            svg = render_svg(modules, size, border)
+        with instrumentation.timer("write"), open(filename, "w", encoding="utf-8") as f:
+            f.write(svg)
+    else:
+        with instrumentation.timer("render"):
+            image = render_image(modules, size, border)
+        with instrumentation.timer("write"):
+            image.save(filename)
+    instrumentation.count("codes generated")
+    if instrumentation.enabled:
+        instrumentation.count("bytes written", os.path.getsize(filename))
+    if verbose:
+        print(f"QR code generated successfully: {filename}")
     
     return filename
 
-def main():
-    """Main function to handle command line usage"""
-    
-    if len(sys.argv) < 2:
+def rasterize_matrix(matrix, box_size):
+    """
+    Turn a QR module matrix into a black-and-white PIL image using NumPy.
+
+    The matrix becomes one byte per module (0 = black, 255 = white), is scaled
+    with np.repeat along each axis, and the resulting buffer is handed to PIL
+    through the "1;8" raw mode, which is PIL's own one-byte-per-pixel layout
+    for mode "1" images, so no per-box drawing or bit unpacking happens.
+
+    Args:
+        matrix (list): Rows of booleans (True = dark) including the border, as
+                       from qr.get_matrix() or add_border()
+        box_size (int): Size of each box in pixels
+
+    Returns:
+        PIL.Image.Image: A mode "1" image, identical to qr.make_image()
+    """
+    from PIL import Image
+
+    np = _load_numpy()
+    modules = np.asarray(matrix, dtype=bool)
+    pixels = np.where(modules, 0, 255).astype(np.uint8)
+
+    # Scale columns on the small matrix first, then repeat whole rows
+    pixels = np.repeat(pixels, box_size, axis=1)
+    pixels = np.repeat(pixels, box_size, axis=0)
+    height, width = pixels.shape
+
+    return Image.frombuffer("1", (width, height), pixels, "raw", "1;8", 0, 1)
+
+def benchmark_rendering(sizes=(1, 4, 10, 20, 40), borders=(0, 4, 16), repeat=20,
+                        url="https://www.example.com/some/landing/page?ref=benchmark"):
+    """
+    Compare rasterize_matrix against qr.make_image across box sizes and borders.
+
+    Encoding is done once per border so only the rendering step is timed, and
+    each pair of images is checked to be pixel-identical before timing.
+
+    Args:
+        sizes (tuple): Box sizes in pixels to try
+        borders (tuple): Border sizes in boxes to try
+        repeat (int): Renders per measurement
+        url (str): Data to encode
+
+    Returns:
+        list: Dicts with 'size', 'border', 'make_image' and 'numpy' seconds
+              per render, plus the 'speedup' ratio
+    """
+    if not _load_numpy():
+        raise RuntimeError("NumPy is required to benchmark the fast rasterizer")
+    import qrcode
+
+    results = []
+    print(f"{'size':>5} {'border':>7} {'make_image':>12} {'numpy':>12} {'speedup':>9}")
+    for border in borders:
+        qr = qrcode.QRCode(error_correction=qrcode.constants.ERROR_CORRECT_L, border=border)
+        qr.add_data(url)
+        qr.make(fit=True)
+        matrix = qr.get_matrix()
+
+        for size in sizes:
+            qr.box_size = size
+            reference = qr.make_image(fill_color="black", back_color="white").get_image()
+            if reference.tobytes() != rasterize_matrix(matrix, size).tobytes():
+                raise AssertionError(f"Rasterizer mismatch at size={size}, border={border}")
+
+            start = time.perf_counter()
+            for _ in range(repeat):
+                qr.make_image(fill_color="black", back_color="white")
+            pil_time = (time.perf_counter() - start) / repeat
+
+            start = time.perf_counter()
+            for _ in range(repeat):
+                rasterize_matrix(matrix, size)
+            np_time = (time.perf_counter() - start) / repeat
+
+            speedup = pil_time / np_time if np_time > 0 else float("inf")
+            results.append({"size": size, "border": border, "make_image": pil_time,
+                            "numpy": np_time, "speedup": speedup})
+            print(f"{size:>5} {border:>7} {pil_time * 1000:>10.3f}ms {np_time * 1000:>10.3f}ms "
+                  f"{speedup:>8.1f}x")
+    return results
+
+def ensure_scheme(url):
+    """Prefix the URL with 'https://' when it has no http(s) scheme"""
+    if not (url.startswith('http://') or url.startswith('https://')):
+        url = 'https://' + url
+    return url
+
+def batch_filename(url, extension=".png"):
+    """
+    Build a deterministic output filename for a URL in batch mode.
+
+    The domain keeps the name readable, and a short hash of the full URL keeps
+    different paths on the same domain from overwriting each other.
+    """
+    domain = url.replace("https://", "").replace("http://", "").replace("www.", "")
+    domain = domain.split("/")[0].replace(".", "_")
+    digest = hashlib.sha1(url.encode("utf-8")).hexdigest()[:10]
+    return f"qr_code_{domain}_{digest}{extension}"
+
+# An input line read_batch_items couldn't parse, kept as an item's url so
+# generate_batch can report it as failed instead of aborting the batch
+InvalidLine = namedtuple("InvalidLine", "text reason")
+
+def read_batch_items(source):
+    """
+    Read (url, filename) pairs from a CSV or NDJSON file, or from stdin.
+
+    CSV rows are 'url[,filename]' with an optional 'url,filename' header row,
+    so a plain list of URLs (one per line) also works. NDJSON lines are objects
+    with a "url" key and an optional "filename" key. Stdin ('-') is treated as
+    NDJSON when its first non-blank line starts with '{', otherwise as CSV.
+
+    Blank lines are skipped. Anything else becomes an item, even if it is
+    unusable (a CSV row with an empty URL, an NDJSON line that isn't valid
+    JSON, isn't an object or has a non-string field), so generate_batch can
+    report it as failed.
+
+    Args:
+        source (str): Path to the input file, or '-' for stdin
+
+    Returns:
+        list: (url, filename) tuples in input order; filename may be None. For
+              NDJSON lines that aren't objects the url is the parsed value, and
+              for lines that aren't valid JSON it is an InvalidLine
+    """
+    if source == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(source, "r", encoding="utf-8", newline="") as f:
+            lines = f.read().splitlines()
+
+    first = next((line.strip() for line in lines if line.strip()), "")
+    is_ndjson = source.lower().endswith((".ndjson", ".jsonl")) or first.startswith("{")
+
+    items = []
+    if is_ndjson:
+        for line_no, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                items.append((InvalidLine(line, f"Invalid JSON on line {line_no}: {e}"), None))
+                continue
+            if not isinstance(record, dict):
+                items.append((record, None))
+                continue
+            url = record.get("url", "")
+            items.append((url.strip() if isinstance(url, str) else url,
+                          record.get("filename") or None))
+    else:
+        header_checked = False
+        for row in csv.reader(lines):
+            if not "".join(row).strip():
+                continue
+            if not header_checked:
+                header_checked = True
+                if row[0].strip().lower() == "url":
+                    continue  # Header row
+            filename = row[1].strip() if len(row) > 1 and row[1].strip() else None
+            items.append((row[0].strip(), filename))
+    return items
+
+# MatrixCache counters, in the order _batch_worker reports them
+CACHE_COUNTERS = ("hits", "disk_hits", "misses")
+
+def _batch_worker(job):
+    """
+    Generate one QR code in a worker process, returning errors instead of raising.
+
+    Returns:
+        tuple: (index, filename, error or None, cache counts), where the cache
+               counts are how much each of CACHE_COUNTERS grew in this worker's
+               matrix cache, so the parent can total them across workers
+    """
+    index, url, filename, size, border, output_format = job
+    before = [getattr(matrix_cache, name) for name in CACHE_COUNTERS]
+    try:
+        # Write to a temporary name first so an interrupted run never leaves a
+        # truncated file behind that a rerun would mistake for a finished one
+        tmp_name = f"{filename}.{os.getpid()}.tmp{OUTPUT_FORMATS[output_format]}"
+        generate_qr_code(url, tmp_name, size, border, verbose=False,
+                         output_format=output_format)
+        os.replace(tmp_name, filename)
+        error = None
+    except Exception as e:
+        try:
+            os.remove(tmp_name)
+        except OSError:
+            pass
+        error = f"{type(e).__name__}: {e}"
+    cache_counts = tuple(getattr(matrix_cache, name) - count
+                         for name, count in zip(CACHE_COUNTERS, before))
+    return index, filename, error, cache_counts
+
+def generate_batch(items, out_dir=".", size=10, border=4, workers=None, progress=True,
+                   cache_dir=None, output_format="png"):
+    """
+    Generate QR codes for many URLs across a pool of worker processes.
+
+    Output names are deterministic (explicit filename, or domain plus a hash of
+    the URL), so rerunning the same input rewrites the same files with the same
+    content. A failure on one item is recorded and the rest of the batch keeps
+    going. Explicit filenames must be plain names: one that is absolute or
+    contains a path separator is reported as failed rather than written
+    outside out_dir.
+
+    Args:
+        items (list): (url, filename) tuples, as returned by read_batch_items
+        out_dir (str): Directory the files are written to
+        size (int): Size of each box in pixels
+        border (int): Border size in boxes
+        workers (int): Number of worker processes (default: CPU count)
+        progress (bool): Print progress and throughput to stderr
+        cache_dir (str): On-disk matrix cache shared by the workers (optional)
+        output_format (str): 'png' or 'svg'
+
+    Returns:
+        dict: Summary with 'total', 'generated', 'failed' and 'skipped' (lists
+              of (index, url, reason) tuples; skipped items repeat an earlier
+              one exactly), 'elapsed' and 'rate'. generated + failed + skipped
+              adds up to total. 'cache' holds the matrix cache's 'hits',
+              'disk_hits' and 'misses' summed over the workers, and 'hit_rate'
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported output format '{output_format}'")
+    extension = OUTPUT_FORMATS[output_format]
+    os.makedirs(out_dir, exist_ok=True)
+
+    jobs = []
+    failed = []
+    skipped = []
+    seen = {}
+    for index, (url, filename) in enumerate(items):
+        if isinstance(url, InvalidLine):
+            failed.append((index, url.text, url.reason))
+            continue
+        if not isinstance(url, str) or not isinstance(filename, (str, type(None))):
+            failed.append((index, url, "Invalid item: 'url' and 'filename' must be strings, "
+                                       f"got {url!r} and {filename!r}"))
+            continue
+        if not url:
+            failed.append((index, url, "Missing URL"))
+            continue
+        url = ensure_scheme(url)
+        if filename is None:
+            filename = batch_filename(url, extension)
+        elif os.path.isabs(filename) or "/" in filename or "\\" in filename:
+            # Names come from the input file, so keep them inside out_dir
+            failed.append((index, url, f"Filename must not contain a path: {filename}"))
+            continue
+        elif not filename.lower().endswith(extension):
+            filename += extension
+        path = os.path.join(out_dir, filename)
+
+        # Two rows writing the same file would race each other in the pool
+        if path in seen:
+            if seen[path] != url:
+                failed.append((index, url, f"Duplicate output filename: {filename}"))
+            else:
+                skipped.append((index, url, f"Same URL and file as an earlier item: {filename}"))
+            continue
+        seen[path] = url
+        jobs.append((index, url, path, size, border, output_format))
+
+    total = len(jobs)
+    generated = 0
+    cache = dict.fromkeys(CACHE_COUNTERS, 0)
+    start = time.perf_counter()
+    # Report roughly every 1% of the batch, but no more often than every item
+    report_every = max(1, total // 100)
+
+    if total:
+        workers = workers or os.cpu_count() or 1
+        chunksize = max(1, min(256, total // (workers * 8)))
+        with ProcessPoolExecutor(max_workers=workers, initializer=configure_matrix_cache,
+                                 initargs=(1024, cache_dir)) as executor:
+            for done, (index, path, error, cache_counts) in enumerate(
+                    executor.map(_batch_worker, jobs, chunksize=chunksize), 1):
+                for name, count in zip(CACHE_COUNTERS, cache_counts):
+                    cache[name] += count
+                if error is None:
+                    generated += 1
+                    # Timers and counters in the worker processes aren't
+                    # collected, so the batch's totals are counted here
+                    instrumentation.count("codes generated")
+                    if instrumentation.enabled:
+                        instrumentation.count("bytes written", os.path.getsize(path))
+                else:
+                    failed.append((index, items[index][0], error))
+                if progress and (done % report_every == 0 or done == total):
+                    elapsed = time.perf_counter() - start
+                    rate = done / elapsed if elapsed > 0 else 0.0
+                    print(f"\r[{done}/{total}] {rate:,.1f} codes/s, {len(failed)} failed",
+                          end="", file=sys.stderr, flush=True)
+        if progress:
+            print(file=sys.stderr)
+
+    elapsed = time.perf_counter() - start
+    failed.sort()
+    lookups = sum(cache.values())
+    cache["hit_rate"] = (cache["hits"] + cache["disk_hits"]) / lookups if lookups else 0.0
+
+    summary = {
+        "total": len(items),
+        "generated": generated,
+        "failed": failed,
+        "skipped": skipped,
+        "cache": cache,
+        "elapsed": elapsed,
+        "rate": generated / elapsed if elapsed > 0 else 0.0,
+    }
+
+    if progress:
+        for index, url, error in failed:
+            print(f"Item {index + 1} ({url}): {error}", file=sys.stderr)
+        print(f"Generated {generated}/{len(items)} QR codes in {elapsed:.2f}s "
+              f"({summary['rate']:,.1f} codes/s), {len(failed)} failed, "
+              f"{len(skipped)} skipped as duplicates", file=sys.stderr)
+        if total:
+            print(f"Matrix cache: {cache['hit_rate']:.1%} hit rate ({cache['hits']} in memory, "
+                  f"{cache['disk_hits']} on disk, {cache['misses']} encoded)", file=sys.stderr)
+
+    return summary
+
+def batch_main(args):
+    """
+    Handle 'python qr_code_generator.py --batch <file|-> [options]'
+
+    Options:
+        --out-dir DIR   Directory for generated files (default: current)
+        --workers N     Number of worker processes (default: CPU count)
+        --size N        Box size in pixels (default: 10)
+        --border N      Border size in boxes (default: 4)
+        --cache-dir DIR Reuse encoded matrices stored in DIR across runs
+        --format FMT    'png' (default) or 'svg'
+        --quiet         Don't print progress or the summary
+    """
+    if not args:
+        print("Usage: python qr_generator.py --batch <urls.csv|urls.ndjson|-> "
+              "[--out-dir DIR] [--workers N] [--size N] [--border N] [--cache-dir DIR] "
+              "[--format png|svg] [--quiet]")
+        return 1
+
+    source = args[0]
+    options = {"--out-dir": ".", "--workers": None, "--size": 10, "--border": 4,
+               "--cache-dir": None, "--format": "png"}
+    progress = True
+    i = 1
+    while i < len(args):
+        arg = args[i]
+        if arg == "--quiet":
+            progress = False
+            i += 1
+        elif arg in options and i + 1 < len(args):
+            value = args[i + 1]
+            if arg not in ("--out-dir", "--cache-dir", "--format"):
+                try:
+                    value = int(value)
+                except ValueError:
+                    print(f"Error: {arg} expects an integer, got '{value}'")
+                    return 1
+            options[arg] = value
+            i += 2
+        else:
+            print(f"Error: Unknown or incomplete option '{arg}'")
+            return 1
+
+    if options["--format"] not in OUTPUT_FORMATS:
+        print(f"Error: --format must be one of {', '.join(OUTPUT_FORMATS)}")
+        return 1
+
+    try:
+        items = read_batch_items(source)
+    except (OSError, ValueError) as e:
+        print(f"Error reading batch input: {e}")
+        return 1
+
+    summary = generate_batch(items, out_dir=options["--out-dir"], size=options["--size"],
+                             border=options["--border"], workers=options["--workers"],
+                             progress=progress, cache_dir=options["--cache-dir"],
+                             output_format=options["--format"])
+    return 1 if summary["failed"] else 0
+
+def main(args=None):
+    """
+    Main function to handle command line usage
+
+    Args:
+        args (list): Command-line arguments after the script name (default: sys.argv[1:])
+    """
+    args = sys.argv[1:] if args is None else args
+
+    if not args:
+        # Run in interactive mode
+        interactive_mode()
+        return 0
+
+    if args[0] in ("-h", "--help"):
         print("Usage: python qr_generator.py <URL> [filename]")
         print("Example: python qr_generator.py https://www.google.com")
         print("Example: python qr_generator.py https://www.google.com my_qr_code.png")
-        return
+        print("Example: python qr_generator.py https://www.google.com my_qr_code.svg")
+        print("Preview: python qr_generator.py --term https://www.google.com")
+        print("Batch:   python qr_generator.py --batch urls.csv --out-dir codes/")
+        print("Server:  python qr_generator.py --serve [--port 8765 | --unix /tmp/qr.sock]")
+        print("Profile: add --profile to any of the above")
+        return 0
+    
+    if args[0] == "--batch":
+        return batch_main(args[1:])
+    if args[0] == "--benchmark":
+        benchmark_rendering()
+        return 0
+    if args[0] == "--serve":
+        import qr_code_server
+        return qr_code_server.main(args[1:])
+    if args[0] == "--term":
+        if len(args) < 2:
+            print("Usage: python qr_generator.py --term <URL>")
+            return 1
+        print(render_terminal(encode_modules(ensure_scheme(args[1]))))
+        return 0
     
-    url = sys.argv[1]
-    filename = sys.argv[2] if len(sys.argv) > 2 else None
+    url = args[0]
+    filename = args[1] if len(args) > 1 else None
     
     # Validate URL format (basic check)
     if not (url.startswith('http://') or url.startswith('https://')):
@@ -68,6 +803,8 @@ def main():
         generate_qr_code(url, filename)
     except Exception as e:
         print(f"Error generating QR code: {e}")
+        return 1
+    return 0
 
 def interactive_mode():
     """Interactive mode for generating QR codes"""
@@ -117,9 +854,4 @@ def interactive_mode():
             print()
 
 if __name__ == "__main__":
-    # Check if command line arguments are provided
-    if len(sys.argv) > 1:
-        main()
-    else:
-        # Run in interactive mode
-        interactive_mode()
+    sys.exit(instrumentation.run_main(main))
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+QR Code Server Load Test - drives a local qr_code_server with concurrent
+keep-alive clients and reports throughput and p50/p90/p99 latency
+"""
+
+import asyncio
+import random
+import sys
+import time
+from urllib.parse import quote
+
+import instrumentation
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, min(len(sorted_values), round(pct / 100 * len(sorted_values) + 0.5)))
+    return sorted_values[rank - 1]
+
+async def run_client(open_connection, targets, latencies, failures):
+    """Send each target over one keep-alive connection, recording latencies"""
+    reader, writer = await open_connection()
+    try:
+        for target in targets:
+            start = time.perf_counter()
+            writer.write(f"GET {target} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode("latin-1"))
+            await writer.drain()
+
+            status_line = await reader.readline()
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                if name.strip().lower() == "content-length":
+                    length = int(value)
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+
+            if not status_line.startswith(b"HTTP/1.1 200"):
+                failures.append(status_line.decode("latin-1").strip())
+    finally:
+        writer.close()
+
+async def load_test(host="127.0.0.1", port=8765, unix_path=None, requests=2000,
+                    concurrency=32, unique=200, output_format="png", size=10):
+    """
+    Fire requests at the server and summarize latency.
+
+    Payloads are drawn from a pool of 'unique' URLs, so with a small pool many
+    requests repeat and exercise request coalescing and the matrix cache.
+
+    Returns:
+        dict: 'requests', 'failures', 'elapsed', 'rate' and latency
+              percentiles 'p50', 'p90', 'p99' and 'max' in seconds
+    """
+    if unix_path:
+        def open_connection():
+            return asyncio.open_unix_connection(unix_path)
+    else:
+        def open_connection():
+            return asyncio.open_connection(host, port)
+
+    rng = random.Random(0)  # Same request mix on every run
+    urls = [f"https://example.com/landing/{i}?ref=load-test" for i in range(unique)]
+    targets = [f"/qr?data={quote(rng.choice(urls), safe='')}&size={size}&format={output_format}"
+               for _ in range(requests)]
+
+    # Deal the requests out round-robin so every client gets a similar share
+    per_client = [targets[i::concurrency] for i in range(concurrency)]
+    latencies = []
+    failures = []
+
+    start = time.perf_counter()
+    await asyncio.gather(*(run_client(open_connection, chunk, latencies, failures)
+                           for chunk in per_client if chunk))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "failures": len(failures),
+        "elapsed": elapsed,
+        "rate": len(latencies) / elapsed if elapsed > 0 else 0.0,
+        "p50": percentile(latencies, 50),
+        "p90": percentile(latencies, 90),
+        "p99": percentile(latencies, 99),
+        "max": latencies[-1] if latencies else 0.0,
+    }
+
+def main(args=None):
+    """
+    Handle 'python qr_code_load_test.py [options]'
+
+    Options:
+        --host HOST       Server host (default: 127.0.0.1)
+        --port N          Server port (default: 8765)
+        --unix PATH       Connect to a Unix socket instead of TCP
+        --requests N      Total requests (default: 2000)
+        --concurrency N   Parallel keep-alive connections (default: 32)
+        --unique N        Distinct URLs in the request mix (default: 200)
+        --size N          Box size in pixels (default: 10)
+        --format FMT      'png' (default) or 'svg'
+    """
+    args = sys.argv[1:] if args is None else args
+    options = {"--host": "127.0.0.1", "--port": 8765, "--unix": None, "--requests": 2000,
+               "--concurrency": 32, "--unique": 200, "--size": 10, "--format": "png"}
+    text_options = ("--host", "--unix", "--format")
+
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg in ("-h", "--help"):
+            print(main.__doc__)
+            return 0
+        if arg in options and i + 1 < len(args):
+            value = args[i + 1]
+            if arg not in text_options:
+                try:
+                    value = int(value)
+                except ValueError:
+                    print(f"Error: {arg} expects an integer, got '{value}'")
+                    return 1
+            options[arg] = value
+            i += 2
+        else:
+            print(f"Error: Unknown or incomplete option '{arg}'")
+            return 1
+
+    try:
+        result = asyncio.run(load_test(
+            host=options["--host"], port=options["--port"], unix_path=options["--unix"],
+            requests=options["--requests"], concurrency=options["--concurrency"],
+            unique=options["--unique"], output_format=options["--format"],
+            size=options["--size"]))
+    except OSError as e:
+        print(f"Error connecting to the server: {e}")
+        return 1
+
+    print(f"Requests:   {result['requests']} ({result['failures']} failed)")
+    print(f"Throughput: {result['rate']:,.1f} req/s over {result['elapsed']:.2f}s")
+    print(f"Latency:    p50 {result['p50'] * 1000:.2f}ms  p90 {result['p90'] * 1000:.2f}ms  "
+          f"p99 {result['p99'] * 1000:.2f}ms  max {result['max'] * 1000:.2f}ms")
+    return 1 if result["failures"] else 0
+
+if __name__ == "__main__":
+    sys.exit(instrumentation.run_main(main))
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+QR Code Server - long-lived asyncio HTTP service around qr_code_generator
+Encodes on a process pool, coalesces identical in-flight requests and returns
+PNG/SVG bytes directly, so callers skip interpreter startup and disk I/O
+"""
+
+import asyncio
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urlsplit, parse_qs
+
+import instrumentation
+import qr_code_generator as qrgen
+
+CONTENT_TYPES = {"png": "image/png", "svg": "image/svg+xml"}
+
+# Bounds on request parameters so one request can't ask for a gigapixel image
+MAX_BOX_SIZE = 100
+MAX_BORDER = 100
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found",
+           405: "Method Not Allowed", 500: "Internal Server Error"}
+
+def render_bytes(data, size=10, border=4, output_format="png",
+                 error_correction=qrgen.ERROR_CORRECT_L):
+    """
+    Encode data and render it in memory, without touching disk.
+
+    Runs in the executor's worker processes, where the matrix cache set up by
+    configure_matrix_cache lets repeated payloads skip encoding.
+
+    Returns:
+        bytes: The PNG or SVG file contents
+    """
+    modules = qrgen.encode_modules(data, error_correction)
+    if output_format == "svg":
+        return qrgen.render_svg(modules, size, border).encode("utf-8")
+    buffer = io.BytesIO()
+    qrgen.render_image(modules, size, border).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+class QRServer:
+    """
+    HTTP/1.1 server answering 'GET /qr?data=...&size=10&border=4&format=png'.
+
+    Requests for the same (data, size, border, format) that arrive while one is
+    already being rendered wait on that render instead of starting another.
+    GET /stats reports request counts; keep-alive connections are supported.
+    """
+
+    def __init__(self, workers=None, cache_size=1024, cache_dir=None):
+        """
+        Args:
+            workers (int): Worker processes for encoding (default: CPU count)
+            cache_size (int): Matrices kept in each worker's memory cache
+            cache_dir (str): On-disk matrix cache shared by the workers (optional)
+        """
+        self.executor = ProcessPoolExecutor(max_workers=workers,
+                                            initializer=qrgen.configure_matrix_cache,
+                                            initargs=(cache_size, cache_dir))
+        self.in_flight = {}
+        self.requests = 0
+        self.renders = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.started = time.time()
+
+    async def render(self, key):
+        """Render a (data, size, border, format) key, sharing in-flight work"""
+        future = self.in_flight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            return await asyncio.shield(future)
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self.executor, render_bytes, *key)
+        self.in_flight[key] = future
+        self.renders += 1
+        try:
+            # Shielded so a client hanging up doesn't cancel the render for the
+            # other requests waiting on it
+            return await asyncio.shield(future)
+        finally:
+            if self.in_flight.get(key) is future:
+                del self.in_flight[key]
+
+    async def respond(self, method, target):
+        """Return (status, content_type, body) for one request"""
+        url = urlsplit(target)
+        if url.path not in ("/qr", "/stats"):
+            return 404, "text/plain", b"Not found\n"
+        if method not in ("GET", "HEAD"):
+            return 405, "text/plain", b"Only GET is supported\n"
+
+        if url.path == "/stats":
+            stats = {
+                "requests": self.requests,
+                "renders": self.renders,
+                "coalesced": self.coalesced,
+                "errors": self.errors,
+                "in_flight": len(self.in_flight),
+                "uptime": time.time() - self.started,
+            }
+            return 200, "application/json", json.dumps(stats).encode("utf-8") + b"\n"
+
+        query = parse_qs(url.query)
+        data = query.get("data", [""])[0]
+        output_format = query.get("format", ["png"])[0].lower()
+        if not data:
+            return 400, "text/plain", b"Missing 'data' parameter\n"
+        if output_format not in CONTENT_TYPES:
+            return 400, "text/plain", b"'format' must be 'png' or 'svg'\n"
+        try:
+            size = int(query.get("size", ["10"])[0])
+            border = int(query.get("border", ["4"])[0])
+        except ValueError:
+            return 400, "text/plain", b"'size' and 'border' must be integers\n"
+        if not (1 <= size <= MAX_BOX_SIZE and 0 <= border <= MAX_BORDER):
+            message = f"'size' must be 1-{MAX_BOX_SIZE} and 'border' 0-{MAX_BORDER}\n"
+            return 400, "text/plain", message.encode("utf-8")
+
+        try:
+            body = await self.render((data, size, border, output_format))
+        except Exception as e:
+            # Too much data for any QR version is the caller's fault (qrcode
+            # raises DataOverflowError or, in newer versions, ValueError)
+            status = 400 if isinstance(e, ValueError) or type(e).__name__ == "DataOverflowError" else 500
+            return status, "text/plain", f"{type(e).__name__}: {e}\n".encode("utf-8")
+        return 200, CONTENT_TYPES[output_format], body
+
+    async def handle_connection(self, reader, writer):
+        """Serve requests on one connection until the client closes it"""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                parts = request_line.decode("latin-1").split()
+                if len(parts) != 3:
+                    break
+                method, target, version = parts
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip().lower()
+
+                connection = headers.get("connection", "")
+                keep_alive = (connection != "close" if version == "HTTP/1.1"
+                              else connection == "keep-alive")
+
+                self.requests += 1
+                status, content_type, body = await self.respond(method, target)
+                if status >= 400:
+                    self.errors += 1
+
+                head = (f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                        f"Content-Type: {content_type}\r\n"
+                        f"Content-Length: {len(body)}\r\n"
+                        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+                writer.write(head.encode("latin-1"))
+                if method != "HEAD":
+                    writer.write(body)
+                with instrumentation.timer("send"):
+                    await writer.drain()
+                instrumentation.count("requests served")
+                instrumentation.count("bytes written", len(head) + (len(body) if method != "HEAD" else 0))
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host="127.0.0.1", port=8765, unix_path=None):
+        """Listen on a TCP port, or on a Unix socket when unix_path is given"""
+        if unix_path:
+            server = await asyncio.start_unix_server(self.handle_connection, path=unix_path)
+            where = f"unix:{unix_path}"
+        else:
+            server = await asyncio.start_server(self.handle_connection, host, port)
+            where = f"http://{host}:{port}"
+
+        print(f"QR code server listening on {where} (GET /qr?data=...&format=png|svg)")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.executor.shutdown(cancel_futures=True)
+            if unix_path and os.path.exists(unix_path):
+                os.remove(unix_path)
+
+def main(args=None):
+    """
+    Handle 'python qr_code_server.py [options]'
+
+    Options:
+        --host HOST     Interface to bind (default: 127.0.0.1)
+        --port N        TCP port (default: 8765)
+        --unix PATH     Listen on a Unix socket instead of TCP
+        --workers N     Encoding processes (default: CPU count)
+        --cache-dir DIR On-disk matrix cache shared by the workers
+    """
+    args = sys.argv[1:] if args is None else args
+    options = {"--host": "127.0.0.1", "--port": 8765, "--unix": None,
+               "--workers": None, "--cache-dir": None}
+
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg in ("-h", "--help"):
+            print(main.__doc__)
+            return 0
+        if arg in options and i + 1 < len(args):
+            value = args[i + 1]
+            if arg in ("--port", "--workers"):
+                try:
+                    value = int(value)
+                except ValueError:
+                    print(f"Error: {arg} expects an integer, got '{value}'")
+                    return 1
+            options[arg] = value
+            i += 2
+        else:
+            print(f"Error: Unknown or incomplete option '{arg}'")
+            return 1
+
+    server = QRServer(workers=options["--workers"], cache_dir=options["--cache-dir"])
+    try:
+        asyncio.run(server.serve(options["--host"], options["--port"], options["--unix"]))
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(instrumentation.run_main(main))
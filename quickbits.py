@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+quickbits - one command for every utility in the repo
+
+    quickbits <subcommand> [args...]
+
+A subcommand's module, and whatever it pulls in (PyMuPDF, Pillow, qrcode,
+tkinter, NumPy), is imported only once that subcommand is chosen, so
+'quickbits tree' and 'quickbits mips' start about as fast as Python itself.
+"""
+
+import sys
+
+import instrumentation
+
+# subcommand: (module, summary). Each module exposes main(args) -> exit code
+COMMANDS = {
+    "tree": ("tree_logger", "Print a directory tree and log it to tree_log.txt"),
+    "mips": ("MIPS_bit_breaker", "Decode MIPS instruction words"),
+    "qr": ("qr_code_generator", "Generate QR codes (single, --batch, --term, --serve)"),
+    "qr-server": ("qr_code_server", "Serve QR codes over HTTP"),
+    "qr-load-test": ("qr_code_load_test", "Load test a running QR code server"),
+    "pdf": ("pdf_chapter_splitter", "Split a PDF into one file per chapter"),
+    "triangle": ("trig_triangle_helper", "Solve triangles (Tk window or --batch)"),
+    "coords": ("coordinate_trig_functions", "Trig functions from a point (or --batch)"),
+    "bench": ("benchmarks", "Benchmark the tools and compare against a baseline"),
+}
+
+# Longest a subcommand may spend importing its module, in milliseconds,
+# checked by 'quickbits --check-startup' and tests/test_startup.py
+STARTUP_BUDGETS_MS = {"tree": 25, "mips": 25}
+
+# Modules the budgeted subcommands must never import
+HEAVY_MODULES = ("fitz", "pymupdf", "PIL", "qrcode", "numpy", "tkinter", "pyarrow")
+
+def load_command(name):
+    """Import the module behind a subcommand and return its main function"""
+    module_name = COMMANDS[name][0]
+    __import__(module_name)
+    return sys.modules[module_name].main
+
+def print_usage():
+    """Print the list of subcommands"""
+    print("Usage: quickbits <subcommand> [args...]")
+    print("       quickbits <subcommand> --help")
+    print("       quickbits <subcommand> [args...] --profile[=json] [--profile-cprofile[=FILE]] [--profile-memory]")
+    print("       quickbits --check-startup")
+    print()
+    print("Subcommands:")
+    for name, (_, summary) in COMMANDS.items():
+        print(f"    {name:<14} {summary}")
+
+def check_startup(repeats=5):
+    """
+    Time how long each budgeted subcommand takes to import, in a fresh
+    interpreter each time, and fail if any goes over STARTUP_BUDGETS_MS or
+    drags in one of HEAVY_MODULES.
+
+    Returns:
+        int: 0 when every subcommand is within budget, 1 otherwise
+    """
+    import os
+    import subprocess
+    import time
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    failed = False
+    for name, budget in STARTUP_BUDGETS_MS.items():
+        probe = ("import sys, time\n"
+                 f"sys.path.insert(0, {here!r})\n"
+                 "start = time.perf_counter()\n"
+                 "import quickbits\n"
+                 f"quickbits.load_command({name!r})\n"
+                 "elapsed = (time.perf_counter() - start) * 1000\n"
+                 "print(elapsed, *[m for m in quickbits.HEAVY_MODULES if m in sys.modules])\n")
+        import_ms, total_ms, heavy = [], [], set()
+        for _ in range(repeats):
+            start = time.perf_counter()
+            output = subprocess.run([sys.executable, "-c", probe], capture_output=True,
+                                    text=True, check=True).stdout.split()
+            total_ms.append((time.perf_counter() - start) * 1000)
+            import_ms.append(float(output[0]))
+            heavy.update(output[1:])
+
+        # Best of several runs, so a busy machine doesn't fail the check
+        best = min(import_ms)
+        ok = best <= budget and not heavy
+        failed |= not ok
+        print(f"{name:<6} import {best:6.1f}ms (budget {budget}ms), "
+              f"process {min(total_ms):6.1f}ms  {'OK' if ok else 'OVER BUDGET'}")
+        if heavy:
+            print(f"       imported heavy modules: {', '.join(sorted(heavy))}")
+    return 1 if failed else 0
+
+def main(args=None):
+    """Dispatch 'quickbits <subcommand> [args...]' to the tool's main function"""
+    args = sys.argv[1:] if args is None else args
+    if not args or args[0] in ("-h", "--help"):
+        print_usage()
+        return 0 if args else 1
+    if args[0] == "--check-startup":
+        return check_startup()
+
+    name = args[0]
+    if name not in COMMANDS:
+        print(f"Error: Unknown subcommand '{name}'")
+        print_usage()
+        return 1
+    try:
+        command = load_command(name)
+    except ImportError as e:
+        print(f"Error: 'quickbits {name}' needs a module that isn't installed: {e}")
+        return 1
+    result = instrumentation.run_main(command, args[1:])
+    return result or 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,28 @@
+import sys
+
+import benchmarks
+
+
+def test_missing_qr_dependency_is_skipped(monkeypatch, tmp_path):
+    # None in sys.modules makes 'import qrcode' raise ImportError
+    monkeypatch.setitem(sys.modules, "qrcode", None)
+    report = benchmarks.run_benchmarks(["qr"], scale=0.01, repeat=1,
+                                       workdir=str(tmp_path), verbose=False)
+    assert "qrcode" in report["results"]["qr"]["skipped"]
+
+
+def test_compare_results_flags_regressions():
+    baseline = {"results": {"tree": {"seconds": 1.0, "units": 10}}}
+    current = {"results": {"tree": {"seconds": 1.2, "units": 10}}}
+    [row] = benchmarks.compare_results(current, baseline, threshold=0.1)
+    assert row["regression"] and abs(row["change"] - 0.2) < 1e-9
+    [row] = benchmarks.compare_results(current, baseline, threshold=0.25)
+    assert not row["regression"]
+
+
+def test_kept_workdir_reuses_workloads(tmp_path):
+    first = benchmarks.run_benchmarks(["tree"], scale=0.1, repeat=1,
+                                      workdir=str(tmp_path), verbose=False)
+    second = benchmarks.run_benchmarks(["tree"], scale=0.1, repeat=1,
+                                       workdir=str(tmp_path), verbose=False)
+    assert first["results"]["tree"]["units"] == second["results"]["tree"]["units"] > 0
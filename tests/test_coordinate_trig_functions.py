@@ -0,0 +1,55 @@
+import math
+import time
+
+import coordinate_trig_functions as ctf
+
+
+def test_exact_values_are_simplified():
+    exact = ctf.exact_trig(1, 2)
+    assert str(exact["r"]) == "√5"
+    assert str(exact["sin"]) == "2√5/5"
+    assert str(exact["cos"]) == "√5/5"
+    assert str(exact["tan"]) == "2"
+    assert str(ctf.exact_trig(3, 4)["sin"]) == "4/5"
+    assert str(ctf.exact_trig(0.1, 0.2)["r"]) == "√5/10"
+
+
+def test_long_decimal_inputs_finish_quickly():
+    points = [(0.3333333333333333, 0.5), (1 / 3, 2 / 7), (math.pi, math.e), (123456.789, 0.000321)]
+    for x, y in points:
+        start = time.perf_counter()
+        exact = ctf.exact_trig(x, y)
+        assert time.perf_counter() - start < 2
+        r = math.hypot(x, y)
+        assert math.isclose(float(exact["r"]), r, rel_tol=1e-9)
+        assert math.isclose(float(exact["sin"]), y / r, rel_tol=1e-9)
+        assert math.isclose(float(exact["cos"]), x / r, rel_tol=1e-9)
+
+
+def test_prime_factors_past_the_sieve():
+    n = 1000003 ** 2 * 999983 * 1000033
+    assert ctf.prime_factors(n) == {1000003: 2, 999983: 1, 1000033: 1}
+    assert ctf.split_square(n) == (1000003, 999983 * 1000033)
+
+
+def test_sieve_is_compact_and_matches_trial_division():
+    ctf._grow_sieve(ctf.SIEVE_LIMIT - 1)
+    spf = ctf._smallest_factor
+    assert spf.itemsize == 4 and len(spf) == ctf.SIEVE_LIMIT
+    for n in list(range(2, 5000)) + [ctf.SIEVE_LIMIT - 1, 999983, 1009 * 1013]:
+        expected = next(p for p in range(2, n + 1) if n % p == 0)
+        assert spf[n] == expected
+    assert str(ctf.exact_trig(1414, 1413)["r"]) == "√3995965"
+
+
+def test_long_decimal_page_falls_back_to_decimals():
+    with open(ctf.trig_from_coords(1 / 3, 0.5, open_browser=False), encoding="utf-8") as f:
+        page = f.read()
+    assert "<pre>0.55470</pre>" in page  # cos, decimal only
+    with open(ctf.trig_from_coords(1, 2, open_browser=False), encoding="utf-8") as f:
+        assert "2&radic;5/5 &asymp; 0.89443" in f.read()
+
+
+def test_points_header_after_blank_lines():
+    rows = [[], ["", ""], ["x", "y"], ["1", "2"], [], ["3", "4"]]
+    assert ctf._parse_points(rows) == ([1.0, 3.0], [2.0, 4.0])
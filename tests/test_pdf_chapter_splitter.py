@@ -0,0 +1,17 @@
+import pytest
+
+pytest.importorskip("fitz")
+
+import benchmarks
+import pdf_chapter_splitter
+
+
+def test_exit_codes_and_option_order(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # chapter_N.pdf is written to the working directory
+    book = tmp_path / "book.pdf"
+    benchmarks.make_chapter_pdf(str(book), pages=20, chapters=4)
+    assert pdf_chapter_splitter.main(["--skip-first", "1", str(book), "--quiet"]) == 0
+    assert sorted(p.name for p in tmp_path.glob("chapter_*.pdf")) == [
+        "chapter_1.pdf", "chapter_2.pdf", "chapter_3.pdf"]
+    assert pdf_chapter_splitter.main([str(tmp_path / "missing.pdf")]) == 1
+    assert pdf_chapter_splitter.main(["--skip-first", "1"]) == 1
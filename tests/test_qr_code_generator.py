@@ -0,0 +1,74 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import qr_code_generator as qrgen
+
+
+def test_read_batch_items_keeps_bad_records(tmp_path):
+    source = tmp_path / "items.ndjson"
+    source.write_text('{"url": "a.com"}\n[1, 2]\n\n{"url": "b.com", "filename": 5}\n{bad json\n'
+                      '{"url": "c.com"}\n')
+    items = qrgen.read_batch_items(str(source))
+    assert items[:3] == [("a.com", None), ([1, 2], None), ("b.com", 5)]
+    bad, filename = items[3]
+    assert isinstance(bad, qrgen.InvalidLine) and filename is None
+    assert bad.text == "{bad json" and bad.reason.startswith("Invalid JSON on line 5")
+    assert items[4] == ("c.com", None)
+
+
+def test_read_batch_items_csv_header_after_blank_line(tmp_path):
+    source = tmp_path / "items.csv"
+    source.write_text("\nurl,filename\na.com,\n,named\n")
+    assert qrgen.read_batch_items(str(source)) == [("a.com", None), ("", "named")]
+
+
+def test_generate_batch_summary_adds_up(tmp_path):
+    pytest.importorskip("qrcode")
+    items = [("a.com", None), ([1, 2], None), ("b.com", 5), ("a.com", None), ("", "named"),
+             (qrgen.InvalidLine("{bad json", "Invalid JSON on line 6"), None)]
+    summary = qrgen.generate_batch(items, out_dir=str(tmp_path), workers=1, progress=False)
+    assert summary["generated"] == 1
+    assert [index for index, _, _ in summary["failed"]] == [1, 2, 4, 5]
+    assert summary["failed"][-1] == (5, "{bad json", "Invalid JSON on line 6")
+    assert [index for index, _, _ in summary["skipped"]] == [3]
+    assert summary["generated"] + len(summary["failed"]) + len(summary["skipped"]) == summary["total"]
+
+
+def test_generate_batch_reports_worker_cache_hits(tmp_path):
+    pytest.importorskip("qrcode")
+    items = [("a.com", None), ("b.com", None)]
+    cache_dir = str(tmp_path / "cache")
+    first = qrgen.generate_batch(items, out_dir=str(tmp_path / "one"), workers=1,
+                                 progress=False, cache_dir=cache_dir)
+    assert first["cache"]["misses"] == 2
+    second = qrgen.generate_batch(items, out_dir=str(tmp_path / "two"), workers=1,
+                                  progress=False, cache_dir=cache_dir)
+    assert second["cache"]["disk_hits"] == 2
+    assert second["cache"]["hit_rate"] == 1.0
+
+
+def test_generate_batch_keeps_files_inside_out_dir(tmp_path):
+    pytest.importorskip("qrcode")
+    out_dir = tmp_path / "out"
+    items = [("a.com", "../escape"), ("b.com", str(tmp_path / "abs.png")), ("c.com", "sub\\x"),
+             ("d.com", "plain")]
+    summary = qrgen.generate_batch(items, out_dir=str(out_dir), workers=1, progress=False)
+    assert [index for index, _, _ in summary["failed"]] == [0, 1, 2]
+    assert sorted(p.name for p in tmp_path.rglob("*.png")) == ["plain.png"]
+
+
+def test_svg_render_never_loads_pil(tmp_path):
+    pytest.importorskip("qrcode")
+    # A fresh interpreter, so PIL isn't already loaded by other tests
+    probe = ("import sys\n"
+             "import qr_code_generator as qrgen\n"
+             f"qrgen.configure_matrix_cache(cache_dir={str(tmp_path / 'cache')!r})\n"
+             f"qrgen.generate_qr_code('https://a.com', {str(tmp_path / 'a.svg')!r}, verbose=False)\n"
+             "print(qrgen.matrix_cache.disk_hits, 'PIL' in sys.modules)\n")
+    runs = [subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True,
+                           check=True, cwd=os.path.dirname(os.path.abspath(qrgen.__file__))).stdout.split()
+            for _ in range(2)]
+    assert runs == [["0", "False"], ["1", "False"]]
@@ -0,0 +1,24 @@
+import MIPS_bit_breaker
+import quickbits
+import tree_logger
+
+
+def test_lightweight_subcommands_stay_within_import_budget(capsys):
+    status = quickbits.check_startup()
+    assert status == 0, capsys.readouterr().out
+
+
+def test_tree_exit_codes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # tree_log.txt is written to the working directory
+    (tmp_path / "src").mkdir()
+    assert tree_logger.main([str(tmp_path / "src")]) == 0
+    assert tree_logger.main([str(tmp_path / "missing")]) == 1
+    assert tree_logger.main([]) == 1
+    assert quickbits.main(["tree", str(tmp_path / "missing")]) == 1
+
+
+def test_mips_rejects_anything_but_one_word(capsys):
+    for arg in ("101", "1" * 33, "0x1FFFFFFFF", "0xZZ"):
+        assert quickbits.main(["mips", arg]) == 1
+        assert capsys.readouterr().out.startswith("Error:")
+    assert MIPS_bit_breaker.parse_instruction("0xFFFFFFFF") == "1" * 32
@@ -0,0 +1,42 @@
+import math
+
+import pytest
+
+import trig_triangle_helper as tth
+
+NAN = float("nan")
+
+
+def unknowns(**known):
+    return {key: known.get(key) for key in tth.TRIANGLE_COLUMNS}
+
+
+@pytest.mark.parametrize("known", [
+    {"A": 10, "a": 3, "b": 4, "c": 5},
+    {"A": 30, "B": 60, "a": 1, "b": 100},
+    {"A": 30, "B": 60, "C": 90, "a": 1, "b": 100},
+])
+def test_contradictory_extra_values_raise(known):
+    with pytest.raises(ValueError, match="Contradictory"):
+        tth.solve_triangle(unknowns(**known))
+
+
+def test_consistent_extra_values_are_accepted():
+    # Angles rounded to two decimals still fit the 3-4-5 triangle
+    results, _ = tth.solve_triangle(unknowns(A=36.87, a=3, b=4, c=5))
+    assert math.isclose(results["C"], 90, abs_tol=1e-9)
+    results, _ = tth.solve_triangle(unknowns(A=30, B=60, a=1, b=math.sqrt(3)))
+    assert math.isclose(results["c"], 2)
+
+
+def test_batch_marks_contradictory_rows_invalid():
+    pytest.importorskip("numpy")
+    rows = [
+        (10, NAN, NAN, 3, 4, 5),          # angle contradicts the sides
+        (30, 60, NAN, 1, 100, NAN),       # second side contradicts the first
+        (36.87, NAN, NAN, 3, 4, 5),       # over-determined but consistent
+        (NAN, NAN, NAN, 3, 4, 5),
+    ]
+    results = tth.solve_triangles(*zip(*rows))
+    assert results["valid"].tolist() == [False, False, True, True]
+    assert results["A"][0] == 10 and math.isnan(results["B"][0])
@@ -1,6 +1,8 @@
 import os
 import sys
 
+import instrumentation
+
 def print_directory_tree(start_path, indent="", is_last=False, log_file=None, current_depth=0, max_depth=None):
     """
     Recursively prints the directory tree structure relative to the start path, logging to a file.
@@ -16,18 +18,22 @@ def print_directory_tree(start_path, indent="", is_last=False, log_file=None, cu
     if max_depth is not None and current_depth >= max_depth:
         return
     try:
-        # Get all items in the directory
-        all_items = os.listdir(start_path)
-        
-        # Filter out .git and target folders
-        items = [item for item in all_items if not ((item == ".git" or item == "target") 
-                                                   and os.path.isdir(os.path.join(start_path, item)))]
+        with instrumentation.timer("directory scan"):
+            # Get all items in the directory
+            all_items = os.listdir(start_path)
+            
+            # Filter out .git and target folders
+            items = [item for item in all_items if not ((item == ".git" or item == "target") 
+                                                       and os.path.isdir(os.path.join(start_path, item)))]
+            item_is_dir = [os.path.isdir(os.path.join(start_path, item)) for item in items]
+        instrumentation.count("directories scanned")
+        instrumentation.count("entries scanned", len(all_items))
         
         num_items = len(items)
         for i, item in enumerate(items):
             item_path = os.path.join(start_path, item)
             is_last_item = (i == num_items - 1)
-            if os.path.isdir(item_path):
+            if item_is_dir[i]:
                 line = indent + ("└── " if is_last_item else "├── ") + item + "/"  # Indicate directory with "/"
                 print_and_log(line, log_file)
                 new_indent = indent + ("    " if is_last_item else "│   ")
@@ -44,10 +50,22 @@ def print_directory_tree(start_path, indent="", is_last=False, log_file=None, cu
 
 def print_and_log(text, log_file):
     """Prints the text to the console and logs it to the file."""
+    if instrumentation.enabled:
+        # Runs once per entry, so the timed path is kept off the default one
+        return _print_and_log_profiled(text, log_file)
     print(text)
     if log_file:
         log_file.write(text + "\n")
 
+def _print_and_log_profiled(text, log_file):
+    """print_and_log with an 'output' timer and a count of bytes logged"""
+    with instrumentation.timer("output"):
+        print(text)
+        if log_file:
+            log_file.write(text + "\n")
+    if log_file:
+        instrumentation.count("bytes written", len(text.encode("utf-8")) + 1)
+
 def print_usage():
     """Prints the usage information for the script."""
     usage_text = """
@@ -57,6 +75,7 @@ USAGE:
     python tree.py <directory_path> [max_depth]
     python tree.py --force [max_depth]
     python tree.py -h
+    quickbits tree <directory_path> [max_depth]
 
 ARGUMENTS:
     directory_path      Path to the directory to visualize
@@ -64,6 +83,7 @@ ARGUMENTS:
 
 OPTIONS:
     --force            Force execution in current directory
+    --profile          Print timings and counters when done (--profile=json for JSON)
     -h, --help         Show this help message
 
 EXAMPLES:
@@ -89,23 +109,31 @@ TREE FORMAT:
 """
     print(usage_text)
 
-def main():
+def main(args=None):
     """
     Main function to parse arguments and start the directory tree printing, logging to a file.
+
+    Args:
+        args (list): Command-line arguments after the script name (default: sys.argv[1:])
+
+    Returns:
+        int: Exit code, 0 on success and 1 on errors
     """
+    args = sys.argv[1:] if args is None else args
+
     # Check for help option first
-    if len(sys.argv) > 1 and sys.argv[1] in ['-h', '--help']:
+    if len(args) > 0 and args[0] in ['-h', '--help']:
         print_usage()
-        return
+        return 0
     
     # Set default values
     start_path = None
     max_depth = None
     force_current_dir = False
     
-    # Use sys.argv to get the command-line arguments
-    if len(sys.argv) > 1:
-        first_arg = sys.argv[1]
+    # Use the command-line arguments
+    if len(args) > 0:
+        first_arg = args[0]
         
         # Check for --force option
         if first_arg == "--force":
@@ -113,47 +141,49 @@ def main():
             start_path = "."  # Current directory
             
             # Check if depth limit was provided after --force
-            if len(sys.argv) > 2:
+            if len(args) > 1:
                 try:
-                    max_depth = int(sys.argv[2])
+                    max_depth = int(args[1])
                     print(f"Depth limit set to: {max_depth}")
                 except ValueError:
-                    print(f"Warning: Invalid depth limit '{sys.argv[2]}'. Using no limit.")
+                    print(f"Warning: Invalid depth limit '{args[1]}'. Using no limit.")
             
             print("Forcing execution in current directory...")
-            continue_script(start_path, max_depth)
+            return continue_script(start_path, max_depth)
             
         else:
             # Regular path argument
             start_path = first_arg
             
             # Check if a depth limit was provided
-            if len(sys.argv) > 2:
+            if len(args) > 1:
                 try:
-                    max_depth = int(sys.argv[2])
+                    max_depth = int(args[1])
                     print(f"Depth limit set to: {max_depth}")
                 except ValueError:
-                    print(f"Warning: Invalid depth limit '{sys.argv[2]}'. Using no limit.")
+                    print(f"Warning: Invalid depth limit '{args[1]}'. Using no limit.")
             
-            continue_script(start_path, max_depth)
+            return continue_script(start_path, max_depth)
     else:
         print("No arguments provided.")
         print("Default relative directory logging is disabled due to caution.")
         print("Use '--force' to run in current directory or provide a specific path.")
         print("Use '-h' for help.")
+        return 1
 
 def continue_script(start_path, max_depth=None):
+    """Log the tree below start_path to tree_log.txt; returns 0, or 1 on errors"""
     log_file_path = "tree_log.txt"
     try:
         with open(log_file_path, "w", encoding="utf-8") as log_file:  # Specify encoding here
             if not os.path.exists(start_path):
                 line = f"Error: The path '{start_path}' does not exist."
                 print_and_log(line, log_file)
-                return
+                return 1
             if not os.path.isdir(start_path):
                 line = f"Error: '{start_path}' is not a directory."
                 print_and_log(line, log_file)
-                return
+                return 1
             
             # Get the display name for the root directory
             if start_path == ".":
@@ -168,8 +198,10 @@ def continue_script(start_path, max_depth=None):
             print_and_log(line, log_file)
             print_directory_tree(start_path, log_file=log_file, max_depth=max_depth)
             print(f"Tree logged to: {os.path.abspath(log_file_path)}")
+            return 0
     except Exception as e:
         print(f"Error opening or writing to log file: {e}")
+        return 1
 
 if __name__ == "__main__":
-    main()
+    sys.exit(instrumentation.run_main(main))
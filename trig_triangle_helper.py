@@ -1,54 +1,286 @@
-import tkinter as tk
-from tkinter import ttk, messagebox
 import math
+import csv
+import os
+import functools
+import sys
+import time
+
+import instrumentation
+
+# The solvers are plain math; only TriangleApp needs Tk, so headless installs
+# without tkinter can still import this module for batch work
+try:
+    import tkinter as tk
+    from tkinter import ttk, messagebox
+except ImportError:
+    tk = ttk = messagebox = None
 
 # --- Triangle Solver Functions ---
-def solve_triangle(values):
-    results = values.copy()
-    steps = {"angles": [], "sides": [], "trig": [], "summary": []}
+ANGLE_NAMES = ("A", "B", "C")
+SIDE_NAMES = ("a", "b", "c")
+TRIANGLE_COLUMNS = list(ANGLE_NAMES + SIDE_NAMES)
+
+# Three given angles are accepted if they add up to 180° within this much, so
+# rounded inputs like 33.33/33.33/113.34 aren't rejected
+ANGLE_SUM_TOLERANCE = 0.05
+
+# With more than three known values, the ones the case didn't use must agree
+# with the solution: side/sin(angle) may differ by this fraction between sides
+SIDE_RATIO_TOLERANCE = 0.005
+
+# Solvable patterns of known values. ASA/AAS and SAS/SSA differ in whether the
+# known side (or angle) sits between the other two known values; AAA fixes the
+# shape but not the size
+CASES = ("SSS", "SAS", "ASA", "AAS", "SSA", "AAA")
+
+def _case_for_mask(mask):
+    """
+    Name the case for a bitmask of known values (bits 0-2: angles A, B, C;
+    bits 3-5: sides a, b, c), or return None if it can't be solved.
+    """
+    angles = [i for i in range(3) if mask & (1 << i)]
+    sides = [i for i in range(3) if mask & (1 << (i + 3))]
+
+    if len(sides) == 3:
+        return "SSS"
+    if len(angles) >= 2 and sides:
+        if len(angles) == 3:
+            return "ASA"
+        missing_angle = 3 - sum(angles)
+        # The side opposite the unknown angle lies between the two known ones
+        return "ASA" if missing_angle in sides else "AAS"
+    if len(sides) == 2 and len(angles) == 1:
+        missing_side = 3 - sum(sides)
+        # The included angle is the one opposite the unknown side
+        return "SAS" if angles[0] == missing_side else "SSA"
+    if len(angles) >= 2:
+        return "AAA"
+    return None
+
+# Every one of the 64 known/unknown patterns, classified once up front
+CASE_TABLE = tuple(_case_for_mask(mask) for mask in range(64))
+
+def known_mask(values):
+    """Bitmask of which of A, B, C, a, b, c are known (not None)"""
+    mask = 0
+    for bit, key in enumerate(TRIANGLE_COLUMNS):
+        if values.get(key) is not None:
+            mask |= 1 << bit
+    return mask
+
+def classify_triangle(values):
+    """
+    Return the solving case for a dict of known values: "SSS", "SAS", "ASA",
+    "AAS", "SSA", "AAA", or None if there isn't enough information.
+    """
+    return CASE_TABLE[known_mask(values)]
+
+def _check_angle_sum(ang, steps):
+    """Fill in the third angle from the other two, or check all three add to 180°"""
+    unknown = [i for i in range(3) if ang[i] is None]
+    if not unknown:
+        if abs(sum(ang) - 180) > ANGLE_SUM_TOLERANCE:
+            raise ValueError(f"Invalid angle values: they add up to {sum(ang):.2f}°, not 180°")
+        return
+    i = unknown[0]
+    missing = 180 - sum(x for x in ang if x is not None)
+    if missing <= 0:
+        raise ValueError("Invalid angle values: sum exceeds 180°")
+    ang[i] = missing
+    if steps is not None:
+        others = " - ".join(ANGLE_NAMES[j] for j in range(3) if j != i)
+        steps["angles"].append(f"{ANGLE_NAMES[i]} = 180° - {others} = {missing:.2f}°")
+
+def _angles_from_sides(ang, side, steps):
+    """Fill every unknown angle from three known sides (law of cosines)"""
+    for i in range(3):
+        if ang[i] is not None:
+            continue
+        j, k = (i + 1) % 3, (i + 2) % 3
+        cos_i = (side[j]**2 + side[k]**2 - side[i]**2) / (2 * side[j] * side[k])
+        ang[i] = math.degrees(math.acos(max(-1.0, min(1.0, cos_i))))
+        if steps is not None:
+            A, a, b, c = ANGLE_NAMES[i], SIDE_NAMES[i], SIDE_NAMES[j], SIDE_NAMES[k]
+            steps["angles"].append(
+                f"{A} = arccos(({b}² + {c}² - {a}²) / (2·{b}·{c})) "
+                f"= arccos({cos_i:.4f}) = {ang[i]:.2f}°"
+            )
 
-    A, B, C = values["A"], values["B"], values["C"]
-    a, b, c = values["a"], values["b"], values["c"]
-
-    # --- Find missing angle if two are known ---
-    known_angles = [x for x in [A, B, C] if x is not None]
-    if len(known_angles) == 2:
-        missing = 180 - sum(known_angles)
-        if missing <= 0:
-            raise ValueError("Invalid angle values: sum exceeds 180°")
-        if A is None:
-            results["A"] = missing
-            steps["angles"].append(f"A = 180° - B - C = {results['A']:.2f}°")
-        elif B is None:
-            results["B"] = missing
-            steps["angles"].append(f"B = 180° - A - C = {results['B']:.2f}°")
-        elif C is None:
-            results["C"] = missing
-            steps["angles"].append(f"C = 180° - A - B = {results['C']:.2f}°")
+def _check_consistent(ang, side):
+    """
+    Check a solved triangle against every value it was given. Solvers only
+    fill in unknowns, so extra known values are still in ang and side as given.
+    """
+    if abs(sum(ang) - 180) > ANGLE_SUM_TOLERANCE:
+        raise ValueError(f"Contradictory values: the angles would add up to {sum(ang):.2f}°, not 180°")
+    if None in side:
+        return
+    ratios = [side[i] / math.sin(math.radians(ang[i])) for i in range(3)]
+    if max(ratios) - min(ratios) > SIDE_RATIO_TOLERANCE * max(ratios):
+        raise ValueError("Contradictory values: the sides don't match the angles "
+                         "(side / sin(opposite angle) must be the same for all three)")
+
+def _solve_sss(ang, side, steps):
+    """Three sides: check the triangle inequality, then the law of cosines"""
+    for i in range(3):
+        if side[i] >= side[(i + 1) % 3] + side[(i + 2) % 3]:
+            raise ValueError(f"Invalid sides: {SIDE_NAMES[i]} must be shorter than "
+                             f"the other two sides combined")
+    _angles_from_sides(ang, side, steps)
+
+def _solve_sas(ang, side, steps):
+    """Two sides and the included angle: law of cosines for the third side"""
+    u = side.index(None)
+    j, k = (u + 1) % 3, (u + 2) % 3
+    side[u] = math.sqrt(side[j]**2 + side[k]**2
+                        - 2 * side[j] * side[k] * math.cos(math.radians(ang[u])))
+    if steps is not None:
+        a, b, c, A = SIDE_NAMES[u], SIDE_NAMES[j], SIDE_NAMES[k], ANGLE_NAMES[u]
+        steps["sides"].append(f"{a} = √({b}² + {c}² - 2·{b}·{c}·cos({A})) = {side[u]:.2f}")
+    _angles_from_sides(ang, side, steps)
+
+def _solve_angle_side(ang, side, steps):
+    """ASA and AAS: third angle from the angle sum, then the law of sines"""
+    _check_angle_sum(ang, steps)
 
     # --- Use Law of Sines ---
-    for side, angle in [("a", "A"), ("b", "B"), ("c", "C")]:
-        if results[side] and results[angle]:
-            num = results[side]
-            denom = math.sin(math.radians(results[angle]))
-            ratio = num / denom
-            results["ratio"] = ratio
-            steps["sides"].append(
-                f"{side} / sin({angle}) = {num:.2f} / sin({results[angle]:.2f}°) "
-                f"= {num:.2f} / {denom:.4f} = {ratio:.4f}"
-            )
-            break
-
-    if "ratio" in results:
-        ratio = results["ratio"]
-        for side, angle in [("a", "A"), ("b", "B"), ("c", "C")]:
-            if results[side] is None and results[angle]:
-                results[side] = ratio * math.sin(math.radians(results[angle]))
-                steps["sides"].append(f"{side} = ratio × sin({angle}) = {results[side]:.2f}")
-            if results[angle] is None and results[side]:
-                val = math.degrees(math.asin(results[side] / ratio))
-                results[angle] = val
-                steps["angles"].append(f"{angle} = arcsin({side}/ratio) = {results[angle]:.2f}°")
+    i = next(i for i in range(3) if side[i] is not None)
+    denom = math.sin(math.radians(ang[i]))
+    ratio = side[i] / denom
+    if steps is not None:
+        steps["sides"].append(
+            f"{SIDE_NAMES[i]} / sin({ANGLE_NAMES[i]}) = {side[i]:.2f} / sin({ang[i]:.2f}°) "
+            f"= {side[i]:.2f} / {denom:.4f} = {ratio:.4f}"
+        )
+    for j in range(3):
+        if side[j] is None:
+            side[j] = ratio * math.sin(math.radians(ang[j]))
+            if steps is not None:
+                steps["sides"].append(f"{SIDE_NAMES[j]} = ratio × sin({ANGLE_NAMES[j]}) = {side[j]:.2f}")
+
+def _solve_ssa(ang, side, steps):
+    """
+    Two sides and a non-included angle: law of sines for a second angle. When
+    the sine gives two angles that both fit, the second triangle is returned.
+
+    Returns:
+        tuple: (angles, sides) of the alternate solution, or None
+    """
+    k = next(i for i in range(3) if ang[i] is not None)
+    u = side.index(None)
+    o = 3 - k - u  # The known side whose opposite angle we solve for
+
+    sin_o = side[o] * math.sin(math.radians(ang[k])) / side[k]
+    if sin_o > 1 + 1e-12:
+        raise ValueError(f"No triangle fits these values: sin({ANGLE_NAMES[o]}) "
+                         f"would be {sin_o:.4f}, which is more than 1")
+
+    solutions = []
+    first = math.degrees(math.asin(min(1.0, sin_o)))
+    for angle_o in (first, 180 - first):
+        third = 180 - ang[k] - angle_o
+        if third <= 1e-9 or (solutions and first >= 90 - 1e-9):
+            continue
+        side_u = side[k] * math.sin(math.radians(third)) / math.sin(math.radians(ang[k]))
+        solutions.append((angle_o, third, side_u))
+    if not solutions:
+        raise ValueError(f"No triangle fits these values: {ANGLE_NAMES[k]} + "
+                         f"{ANGLE_NAMES[o]} would exceed 180°")
+
+    ang[o], ang[u], side[u] = solutions[0]
+    if steps is not None:
+        Ak, Ao, Au = ANGLE_NAMES[k], ANGLE_NAMES[o], ANGLE_NAMES[u]
+        steps["angles"].append(
+            f"sin({Ao}) = {SIDE_NAMES[o]}·sin({Ak}) / {SIDE_NAMES[k]} = {sin_o:.4f}, "
+            f"so {Ao} = arcsin({sin_o:.4f}) = {ang[o]:.2f}°"
+        )
+        steps["angles"].append(f"{Au} = 180° - {Ak} - {Ao} = {ang[u]:.2f}°")
+        steps["sides"].append(
+            f"{SIDE_NAMES[u]} = {SIDE_NAMES[k]}·sin({Au}) / sin({Ak}) = {side[u]:.2f}"
+        )
+
+    if len(solutions) < 2:
+        return None
+    alt_ang, alt_side = list(ang), list(side)
+    alt_ang[o], alt_ang[u], alt_side[u] = solutions[1]
+    if steps is not None:
+        steps["summary"].append(
+            f"Ambiguous case (SSA): a second triangle also fits, with "
+            f"{ANGLE_NAMES[o]} = 180° - {ang[o]:.2f}° = {alt_ang[o]:.2f}°, "
+            f"{ANGLE_NAMES[u]} = {alt_ang[u]:.2f}°, {SIDE_NAMES[u]} = {alt_side[u]:.2f}"
+        )
+    return alt_ang, alt_side
+
+def _solve_aaa(ang, side, steps):
+    """Angles only: the shape is fixed but any size fits"""
+    _check_angle_sum(ang, steps)
+    if steps is not None:
+        steps["sides"].append("Side lengths can't be determined from angles alone.")
+
+# Each case goes straight to its closed-form routine
+SOLVERS = {
+    "SSS": _solve_sss,
+    "SAS": _solve_sas,
+    "ASA": _solve_angle_side,
+    "AAS": _solve_angle_side,
+    "SSA": _solve_ssa,
+    "AAA": _solve_aaa,
+}
+
+def solve_triangle(values, with_steps=True):
+    """
+    Solve a triangle from a dict of known values (None for unknowns).
+
+    The known values are classified once (see classify_triangle) and handed to
+    the closed-form routine for that case.
+
+    Args:
+        values (dict): Angles "A", "B", "C" in degrees and sides "a", "b", "c"
+        with_steps (bool): Build the worked-solution text; when False the step
+                           lists stay empty, which skips all the formatting
+
+    Returns:
+        tuple: (results dict, steps dict of lists of strings). The results
+               also hold "case", and for an ambiguous SSA input "alternate":
+               a dict of the second triangle's values (otherwise None)
+
+    Raises:
+        ValueError: If the values are out of range, contradictory or not
+                    enough to solve the triangle
+    """
+    results = values.copy()
+    steps = {"angles": [], "sides": [], "trig": [], "summary": []}
+
+    for key in ANGLE_NAMES:
+        if values.get(key) is not None and not 0 < values[key] < 180:
+            raise ValueError(f"Invalid angle {key}: it must be between 0° and 180°")
+    for key in SIDE_NAMES:
+        if values.get(key) is not None and values[key] <= 0:
+            raise ValueError(f"Invalid side {key}: it must be greater than 0")
+
+    case = classify_triangle(values)
+    if case is None:
+        raise ValueError("Not enough information: enter three values including "
+                         "at least one side, or two angles")
+
+    ang = [values.get(key) for key in ANGLE_NAMES]
+    side = [values.get(key) for key in SIDE_NAMES]
+    alternate = SOLVERS[case](ang, side, steps if with_steps else None)
+    if sum(values.get(key) is not None for key in TRIANGLE_COLUMNS) > 3:
+        _check_consistent(ang, side)
+
+    results.update(zip(ANGLE_NAMES, ang))
+    results.update(zip(SIDE_NAMES, side))
+    results["case"] = case
+    results["alternate"] = None
+    if alternate:
+        results["alternate"] = dict(zip(TRIANGLE_COLUMNS, alternate[0] + alternate[1]))
+
+    # Everything below only produces step text
+    if not with_steps:
+        return results, steps
+
+    steps["summary"].insert(0, f"Case: {case}")
 
     # --- Trig Functions ---
     if results.get("A") and results.get("a") and results.get("b") and results.get("c"):
@@ -65,12 +297,14 @@ def solve_triangle(values):
         else:
             tri_type = "Obtuse"
 
-        if abs(results["a"]-results["b"])<1e-6 and abs(results["b"]-results["c"])<1e-6:
-            tri_type += " Equilateral"
-        elif abs(results["a"]-results["b"])<1e-6 or abs(results["b"]-results["c"])<1e-6 or abs(results["a"]-results["c"])<1e-6:
-            tri_type += " Isosceles"
-        else:
-            tri_type += " Scalene"
+        # Without sides (AAA) only the angle type is known
+        if all(results[x] for x in ["a", "b", "c"]):
+            if abs(results["a"]-results["b"])<1e-6 and abs(results["b"]-results["c"])<1e-6:
+                tri_type += " Equilateral"
+            elif abs(results["a"]-results["b"])<1e-6 or abs(results["b"]-results["c"])<1e-6 or abs(results["a"]-results["c"])<1e-6:
+                tri_type += " Isosceles"
+            else:
+                tri_type += " Scalene"
 
         steps["summary"].append(f"Triangle Type: {tri_type}")
 
@@ -88,13 +322,361 @@ def solve_triangle(values):
     return results, steps
 
 
+# --- Batch Solver ---
+def _batch_sss(ang, side):
+    """Vectorized _solve_sss on 3×n arrays; returns the rows that solved"""
+    import numpy as np
+
+    # Row i of the rolled arrays holds the two sides other than side i
+    side_j = np.roll(side, -1, axis=0)
+    side_k = np.roll(side, -2, axis=0)
+    ok = (side < side_j + side_k).all(axis=0)
+    cos_i = (side_j**2 + side_k**2 - side**2) / (2 * side_j * side_k)
+    ang[:] = np.where(np.isnan(ang), np.degrees(np.arccos(np.clip(cos_i, -1, 1))), ang)
+    return ok, None
+
+def _batch_sas(ang, side):
+    """Vectorized _solve_sas"""
+    import numpy as np
+
+    cols = np.arange(side.shape[1])
+    u = np.isnan(side).argmax(axis=0)
+    side_j, side_k = side[(u + 1) % 3, cols], side[(u + 2) % 3, cols]
+    side[u, cols] = np.sqrt(side_j**2 + side_k**2
+                            - 2 * side_j * side_k * np.cos(np.radians(ang[u, cols])))
+    _batch_sss(ang, side)
+    return np.ones(len(cols), dtype=bool), None
+
+def _batch_angle_sum(ang):
+    """Vectorized _check_angle_sum; returns the rows whose angles are consistent"""
+    import numpy as np
+
+    unknown = np.isnan(ang)
+    total = np.nansum(ang, axis=0)
+    missing = 180 - total
+    ok = np.where(unknown.any(axis=0), missing > 0,
+                  np.abs(total - 180) <= ANGLE_SUM_TOLERANCE)
+    ang[:] = np.where(unknown, missing, ang)
+    return ok
+
+def _batch_angle_side(ang, side):
+    """Vectorized _solve_angle_side (ASA and AAS)"""
+    import numpy as np
+
+    ok = _batch_angle_sum(ang)
+    cols = np.arange(side.shape[1])
+    i = (~np.isnan(side)).argmax(axis=0)
+    ratio = side[i, cols] / np.sin(np.radians(ang[i, cols]))
+    side[:] = np.where(np.isnan(side), ratio * np.sin(np.radians(ang)), side)
+    return ok, None
+
+def _batch_ssa(ang, side):
+    """Vectorized _solve_ssa; also returns the alternate (angles, sides)"""
+    import numpy as np
+
+    cols = np.arange(side.shape[1])
+    k = (~np.isnan(ang)).argmax(axis=0)
+    u = np.isnan(side).argmax(axis=0)
+    o = 3 - k - u
+    angle_k = ang[k, cols]
+    sin_k = np.sin(np.radians(angle_k))
+
+    sin_o = side[o, cols] * sin_k / side[k, cols]
+    first = np.degrees(np.arcsin(np.clip(sin_o, -1, 1)))
+    third = 180 - angle_k - first
+    ok = (sin_o <= 1 + 1e-12) & (third > 1e-9)
+
+    second = 180 - first
+    alt_third = 180 - angle_k - second
+    has_alt = ok & (first < 90 - 1e-9) & (alt_third > 1e-9)
+    alt_ang, alt_side = ang.copy(), side.copy()
+
+    ang[o, cols], ang[u, cols] = first, third
+    side[u, cols] = side[k, cols] * np.sin(np.radians(third)) / sin_k
+    alt_ang[o, cols], alt_ang[u, cols] = second, alt_third
+    alt_side[u, cols] = side[k, cols] * np.sin(np.radians(alt_third)) / sin_k
+    alt_ang[:, ~has_alt] = np.nan
+    alt_side[:, ~has_alt] = np.nan
+    return ok, (alt_ang, alt_side)
+
+def _batch_aaa(ang, side):
+    """Vectorized _solve_aaa"""
+    return _batch_angle_sum(ang), None
+
+BATCH_SOLVERS = {
+    "SSS": _batch_sss,
+    "SAS": _batch_sas,
+    "ASA": _batch_angle_side,
+    "AAS": _batch_angle_side,
+    "SSA": _batch_ssa,
+    "AAA": _batch_aaa,
+}
+
+def solve_triangles(A, B, C, a, b, c):
+    """
+    Solve many triangles at once with NumPy.
+
+    Each argument is an array (or list) of the same length, with NaN for
+    unknown values. Rows are classified with the same case table as
+    solve_triangle, grouped by case, and each group is solved with one
+    vectorized closed-form routine. Rows that solve_triangle would reject
+    (out-of-range or contradictory values, not enough information) are marked
+    invalid and keep their input values instead of raising, so one bad row
+    doesn't stop the batch. No step text is built; use triangle_steps() for
+    the rows that need it.
+
+    Returns:
+        dict: Float arrays "A", "B", "C", "a", "b", "c", "perimeter" and "area"
+              (NaN where unknown); "alt_A" ... "alt_c" with the second
+              triangle of ambiguous SSA rows (NaN elsewhere); string arrays
+              "type" ("" where the angles aren't known) and "case" ("" where
+              unsolvable); and a boolean array "valid"
+    """
+    import numpy as np
+
+    angles = np.array([A, B, C], dtype=float)
+    sides = np.array([a, b, c], dtype=float)
+    if angles.ndim != 2 or sides.shape != angles.shape:
+        raise ValueError("A, B, C, a, b and c must be 1-D arrays of the same length")
+    count = angles.shape[1]
+    alt_angles = np.full_like(angles, np.nan)
+    alt_sides = np.full_like(sides, np.nan)
+
+    known = np.concatenate([~np.isnan(angles), ~np.isnan(sides)])
+    valid = ~((known[:3] & ((angles <= 0) | (angles >= 180))).any(axis=0)
+              | (known[3:] & (sides <= 0)).any(axis=0))
+
+    # Look every row's known-value pattern up in the precomputed case table
+    masks = (known * (1 << np.arange(6))[:, None]).sum(axis=0)
+    case_codes = np.array([CASES.index(case) if case else len(CASES) for case in CASE_TABLE])
+    codes = case_codes[masks]
+    valid &= codes < len(CASES)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for code, case in enumerate(CASES):
+            rows = np.nonzero((codes == code) & valid)[0]
+            if not rows.size:
+                continue
+            ang, side = angles[:, rows], sides[:, rows]
+            ok, alternate = BATCH_SOLVERS[case](ang, side)
+            valid[rows[~ok]] = False
+            angles[:, rows[ok]] = ang[:, ok]
+            sides[:, rows[ok]] = side[:, ok]
+            if alternate is not None:
+                alt_angles[:, rows[ok]] = alternate[0][:, ok]
+                alt_sides[:, rows[ok]] = alternate[1][:, ok]
+
+        # Rows with more than three known values: the extras must agree with
+        # the solution (see _check_consistent)
+        extra = valid & (known.sum(axis=0) > 3)
+        angle_sum_ok = np.abs(angles.sum(axis=0) - 180) <= ANGLE_SUM_TOLERANCE
+        ratios = sides / np.sin(np.radians(angles))
+        spread = ratios.max(axis=0) - ratios.min(axis=0)
+        ratio_ok = (np.isnan(sides).any(axis=0)
+                    | (spread <= SIDE_RATIO_TOLERANCE * ratios.max(axis=0)))
+        valid &= ~extra | (angle_sum_ok & ratio_ok)
+        alt_angles[:, ~valid] = np.nan
+        alt_sides[:, ~valid] = np.nan
+
+        # Angles and sides only count where the row solved
+        angles[:, ~valid] = np.where(known[:3, ~valid], angles[:, ~valid], np.nan)
+        sides[:, ~valid] = np.where(known[3:, ~valid], sides[:, ~valid], np.nan)
+
+        # --- Classification ---
+        classified = valid & (~np.isnan(angles)).all(axis=0)
+        right = (np.abs(angles - 90) < 0.5).any(axis=0)
+        acute = (angles < 90).all(axis=0)
+        angle_kind = np.where(right, "Right", np.where(acute, "Acute", "Obtuse"))
+
+        all_sides = valid & (~np.isnan(sides)).all(axis=0)
+        ab = np.abs(sides[0] - sides[1]) < 1e-6
+        bc = np.abs(sides[1] - sides[2]) < 1e-6
+        ac = np.abs(sides[0] - sides[2]) < 1e-6
+        side_kind = np.where(ab & bc, " Equilateral",
+                             np.where(ab | bc | ac, " Isosceles", " Scalene"))
+        side_kind = np.where(all_sides, side_kind, "")
+        tri_type = np.where(classified, np.char.add(angle_kind, side_kind), "")
+
+        # --- Perimeter & Area ---
+        perimeter = np.where(all_sides, sides.sum(axis=0), np.nan)
+        semi = perimeter / 2
+        product = semi * (semi - sides[0]) * (semi - sides[1]) * (semi - sides[2])
+        area = np.where(all_sides, np.sqrt(np.maximum(product, 0)), np.nan)
+
+    case_names = np.array(CASES + ("",))
+    results = {
+        "A": angles[0], "B": angles[1], "C": angles[2],
+        "a": sides[0], "b": sides[1], "c": sides[2],
+        "perimeter": perimeter, "area": area,
+        "type": tri_type, "case": case_names[codes], "valid": valid,
+    }
+    for i, key in enumerate(TRIANGLE_COLUMNS):
+        results["alt_" + key] = alt_angles[i] if i < 3 else alt_sides[i - 3]
+    return results
+
+def triangle_steps(A=None, B=None, C=None, a=None, b=None, c=None):
+    """
+    Build the worked-solution text for one triangle, for rows of a batch that
+    need it. NaN inputs are treated as unknown, like in solve_triangles.
+
+    Returns:
+        list: Step strings in display order, or an error message
+    """
+    values = {}
+    for key, value in zip(TRIANGLE_COLUMNS, (A, B, C, a, b, c)):
+        values[key] = None if value is None or math.isnan(value) else float(value)
+    try:
+        _, steps = solve_triangle(values)
+    except ValueError as e:
+        return [f"Error: {e}"]
+    return [s for cat in ("angles", "sides", "trig", "summary") for s in steps[cat]]
+
+def read_triangle_table(path):
+    """
+    Read columns A, B, C, a, b, c from a CSV or Parquet file.
+
+    Missing columns and empty cells are unknown (NaN).
+
+    Returns:
+        dict: Column name -> float NumPy array
+    """
+    import numpy as np
+
+    if path.lower().endswith(".parquet"):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ValueError("Reading Parquet files requires pyarrow (pip install pyarrow)")
+        table = pq.read_table(path)
+        count = table.num_rows
+        columns = {}
+        for key in TRIANGLE_COLUMNS:
+            if key in table.column_names:
+                column = table.column(key).to_numpy(zero_copy_only=False)
+                columns[key] = np.asarray(column, dtype=float)
+            else:
+                columns[key] = np.full(count, np.nan)
+        return columns
+
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = [name.strip() for name in next(reader, [])]
+        rows = list(reader)
+
+    columns = {}
+    for key in TRIANGLE_COLUMNS:
+        if key in header:
+            i = header.index(key)
+            cells = (row[i].strip() if i < len(row) else "" for row in rows)
+            columns[key] = np.array([float(x) if x else np.nan for x in cells])
+        else:
+            columns[key] = np.full(len(rows), np.nan)
+    return columns
+
+def write_triangle_table(path, results, steps=None):
+    """
+    Write solve_triangles results (and optional step text) to CSV or Parquet.
+
+    Args:
+        path (str): Output file; a .parquet extension selects Parquet
+        results (dict): As returned by solve_triangles
+        steps (list): Optional step text per row, written as a "steps" column
+    """
+    names = (TRIANGLE_COLUMNS + ["perimeter", "area", "type", "case", "valid"]
+             + ["alt_" + key for key in TRIANGLE_COLUMNS])
+
+    if path.lower().endswith(".parquet"):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ValueError("Writing Parquet files requires pyarrow (pip install pyarrow)")
+        data = {name: results[name] for name in names}
+        if steps is not None:
+            data["steps"] = steps
+        pq.write_table(pa.table(data), path)
+        return
+
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(names + (["steps"] if steps is not None else []))
+        columns = [results[name].tolist() for name in names]
+        for i, row in enumerate(zip(*columns)):
+            # Unknown values are written as empty cells, like the input
+            row = ["" if isinstance(v, float) and math.isnan(v) else v for v in row]
+            if steps is not None:
+                row.append(steps[i])
+            writer.writerow(row)
+
+def batch_main(args):
+    """
+    Handle 'python trig_triangle_helper.py --batch <input> <output> [--steps]'
+
+    Input and output are CSV files (or Parquet, by the .parquet extension) with
+    columns A, B, C, a, b, c; empty cells are unknown. --steps adds a column of
+    worked-solution text, which is much slower than the vectorized solve.
+    """
+    if len(args) < 2:
+        print("Usage: python trig_triangle_helper.py --batch <input.csv|.parquet> "
+              "<output.csv|.parquet> [--steps]")
+        return 1
+    input_path, output_path = args[0], args[1]
+    with_steps = "--steps" in args[2:]
+
+    try:
+        with instrumentation.timer("read"):
+            columns = read_triangle_table(input_path)
+    except (OSError, ValueError) as e:
+        print(f"Error reading {input_path}: {e}")
+        return 1
+
+    start = time.perf_counter()
+    with instrumentation.timer("solve"):
+        results = solve_triangles(*(columns[key] for key in TRIANGLE_COLUMNS))
+    elapsed = time.perf_counter() - start
+
+    steps = None
+    if with_steps:
+        with instrumentation.timer("steps"):
+            steps = [" | ".join(triangle_steps(*row))
+                     for row in zip(*(columns[key].tolist() for key in TRIANGLE_COLUMNS))]
+
+    try:
+        with instrumentation.timer("write"):
+            write_triangle_table(output_path, results, steps)
+    except (OSError, ValueError) as e:
+        print(f"Error writing {output_path}: {e}")
+        return 1
+
+    count = len(results["valid"])
+    instrumentation.count("triangles solved", count)
+    if instrumentation.enabled:
+        instrumentation.count("bytes written", os.path.getsize(output_path))
+    invalid = count - int(results["valid"].sum())
+    print(f"Solved {count} triangles in {elapsed:.3f}s ({invalid} invalid) -> {output_path}")
+    return 0
+
+
 # --- Tkinter UI ---
+# Wait this long after the last keystroke before re-solving
+LIVE_DEBOUNCE_MS = 150
+
+@functools.lru_cache(maxsize=512)
+def solve_triangle_cached(key):
+    """
+    Memoized solve_triangle for a tuple of (A, B, C, a, b, c) with None for
+    unknowns. The returned dicts are shared between calls, so don't modify them.
+    """
+    return solve_triangle(dict(zip(TRIANGLE_COLUMNS, key)))
+
 class TriangleApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Triangle Solver")
 
         self.entries = {}
+        self._pending = None      # after() id of the scheduled live update
+        self._shown_key = None    # Input tuple currently displayed
         frm = ttk.Frame(root, padding=10)
         frm.pack(side="left", fill="y")
 
@@ -116,11 +698,18 @@ class TriangleApp:
             e.pack(side="left", padx=2)
             self.entries[key] = e
 
+        # Re-solve as the user types, debounced so bursts of keys solve once
+        for e in self.entries.values():
+            e.bind("<KeyRelease>", lambda event: self.schedule_update())
+
         btn_frame = ttk.Frame(frm)
         btn_frame.pack(pady=10)
         ttk.Button(btn_frame, text="Calculate", command=self.calculate).pack(side="left", padx=5)
         ttk.Button(btn_frame, text="Clear", command=self.clear).pack(side="left", padx=5)
 
+        self.status = ttk.Label(frm, text="", foreground="darkred", wraplength=200)
+        self.status.pack(pady=5)
+
         # Output tabs
         self.notebook = ttk.Notebook(root)
         self.notebook.pack(side="right", expand=True, fill="both")
@@ -134,14 +723,31 @@ class TriangleApp:
         self.tree = ttk.Treeview(self.table_frame, columns=("value",), show="headings")
         self.tree.heading("value", text="Value")
         self.tree.pack(expand=True, fill="both")
+        # One row per value, shown or hidden as values become known
+        self.tree_rows = {k: self.tree.insert("", "end", values=("",)) for k in TRIANGLE_COLUMNS}
+        for iid in self.tree_rows.values():
+            self.tree.detach(iid)
 
         self.canvas = tk.Canvas(root, width=400, height=400, bg="darkgray")
         self.canvas.pack(side="bottom", pady=10)
 
+        # Canvas items are created once and then moved/relabelled in place
+        side_font, vertex_font, angle_font = ("Arial", 10, "bold"), ("Arial", 12, "bold"), ("Arial", 10)
+        self.placeholder = self.canvas.create_text(200, 200, text="Triangle will display here", fill="black")
+        self.polygon = self.canvas.create_polygon(0, 0, 0, 0, 0, 0, outline="black", fill="",
+                                                  width=2, state="hidden")
+        self.side_labels = {k: self.canvas.create_text(0, 0, fill="blue", font=side_font, state="hidden")
+                            for k in SIDE_NAMES}
+        self.vertex_labels = {k: self.canvas.create_text(0, 0, text=k, fill="red", font=vertex_font,
+                                                         state="hidden")
+                              for k in ANGLE_NAMES}
+        self.angle_labels = {k: self.canvas.create_text(0, 0, fill="red", font=angle_font, state="hidden")
+                             for k in ANGLE_NAMES}
+
     def draw_triangle(self, vals):
-        self.canvas.delete("all")
         if not (vals["a"] and vals["b"] and vals["c"]):
-            self.canvas.create_text(200, 200, text="Triangle will display here", fill="black")
+            self.canvas.itemconfigure("all", state="hidden")
+            self.canvas.itemconfigure(self.placeholder, state="normal")
             return
 
         # Simplified scaling
@@ -157,66 +763,160 @@ class TriangleApp:
         y = math.sqrt(abs(b**2 - x**2))
         Cx, Cy = Ax + x, Ay - y
 
-        # Draw triangle outline
-        self.canvas.create_polygon(Ax, Ay, Bx, By, Cx, Cy, outline="black", fill="", width=2)
+        # Move the triangle outline
+        self.canvas.itemconfigure(self.placeholder, state="hidden")
+        self.canvas.coords(self.polygon, Ax, Ay, Bx, By, Cx, Cy)
+        self.canvas.itemconfigure(self.polygon, state="normal")
 
         # --- Labels ---
         # Side lengths in blue
-        self.canvas.create_text((Ax+Bx)/2, Ay+15, text=f"c={vals['c']:.2f}", fill="blue", font=("Arial", 10, "bold"))
-        self.canvas.create_text((Ax+Cx)/2-10, (Ay+Cy)/2, text=f"b={vals['b']:.2f}", fill="blue", font=("Arial", 10, "bold"))
-        self.canvas.create_text((Bx+Cx)/2+10, (By+Cy)/2, text=f"a={vals['a']:.2f}", fill="blue", font=("Arial", 10, "bold"))
+        for key, (lx, ly) in zip(SIDE_NAMES, [((Bx+Cx)/2+10, (By+Cy)/2),
+                                             ((Ax+Cx)/2-10, (Ay+Cy)/2),
+                                             ((Ax+Bx)/2, Ay+15)]):
+            self.canvas.coords(self.side_labels[key], lx, ly)
+            self.canvas.itemconfigure(self.side_labels[key], text=f"{key}={vals[key]:.2f}", state="normal")
 
         # Angles in red
-        self.canvas.create_text(Ax-25, Ay, text="A", fill="red", font=("Arial", 12, "bold"))
-        self.canvas.create_text(Bx+25, By, text="B", fill="red", font=("Arial", 12, "bold"))
-        self.canvas.create_text(Cx, Cy-25, text="C", fill="red", font=("Arial", 12, "bold"))
-
-        if vals["A"]:
-            self.canvas.create_text(Ax-15, Ay+15, text=f"{vals['A']:.1f}°", fill="red", font=("Arial", 10))
-        if vals["B"]:
-            self.canvas.create_text(Bx+15, By+15, text=f"{vals['B']:.1f}°", fill="red", font=("Arial", 10))
-        if vals["C"]:
-            self.canvas.create_text(Cx, Cy-40, text=f"{vals['C']:.1f}°", fill="red", font=("Arial", 10))
-
-
-    def calculate(self):
+        vertex_positions = {"A": (Ax-25, Ay), "B": (Bx+25, By), "C": (Cx, Cy-25)}
+        angle_positions = {"A": (Ax-15, Ay+15), "B": (Bx+15, By+15), "C": (Cx, Cy-40)}
+        for key in ANGLE_NAMES:
+            self.canvas.coords(self.vertex_labels[key], *vertex_positions[key])
+            self.canvas.itemconfigure(self.vertex_labels[key], state="normal")
+            self.canvas.coords(self.angle_labels[key], *angle_positions[key])
+            if vals[key]:
+                self.canvas.itemconfigure(self.angle_labels[key], text=f"{vals[key]:.1f}°", state="normal")
+            else:
+                self.canvas.itemconfigure(self.angle_labels[key], state="hidden")
+
+    def read_inputs(self):
+        """Return the entries as an (A, B, C, a, b, c) tuple, None for blanks"""
+        return tuple(float(self.entries[k].get()) if self.entries[k].get().strip() else None
+                     for k in TRIANGLE_COLUMNS)
+
+    def schedule_update(self):
+        """Debounce live solving: restart the timer on every change"""
+        if self._pending is not None:
+            self.root.after_cancel(self._pending)
+        self._pending = self.root.after(LIVE_DEBOUNCE_MS, self.live_update)
+
+    def live_update(self):
+        """Solve the current inputs, reporting problems in the status line"""
+        self._pending = None
         try:
-            values = {k: (float(v.get()) if v.get() else None) for k, v in self.entries.items()}
-            if sum(1 for v in values.values() if v is not None) < 3:
-                messagebox.showerror("Error", "Enter at least 3 values!")
-                return
-            results, steps = solve_triangle(values)
+            key = self.read_inputs()
+        except ValueError:
+            self.status.configure(text="Values must be numbers.")
+            return
+        if key == self._shown_key:
+            # Back to the inputs already on screen, e.g. after deleting a typo
+            self.status.configure(text="")
+            return
+        if classify_triangle(dict(zip(TRIANGLE_COLUMNS, key))) is None:
+            # Still typing: keep the last result up until the input is solvable
+            self.status.configure(text="Enter three values including at least one side, or two angles.")
+            return
+        try:
+            results, steps = solve_triangle_cached(key)
         except ValueError as e:
-            messagebox.showerror("Error", str(e))
+            self.status.configure(text=str(e))
+            return
+        self.status.configure(text="")
+        self.show(key, results, steps)
+
+    def show(self, key, results, steps):
+        """Display a solution, skipping the redraw if it is already shown"""
+        if key == self._shown_key:
             return
+        self._shown_key = key
 
         # Steps output
         self.text_output.delete("1.0", tk.END)
+        lines = []
         for cat, label in [("angles", "ANGLES"), ("sides", "SIDES"), ("trig", "TRIG FUNCTIONS"), ("summary", "SUMMARY")]:
-            self.text_output.insert(tk.END, f"\n=== {label} ===\n\n")
-            for s in steps[cat]:
-                self.text_output.insert(tk.END, "• " + s + "\n")
+            lines.append(f"\n=== {label} ===\n\n")
+            lines.extend("• " + s + "\n" for s in steps[cat])
+        self.text_output.insert(tk.END, "".join(lines))
 
         # Table summary
-        for i in self.tree.get_children():
-            self.tree.delete(i)
-        for k in ["A", "B", "C", "a", "b", "c"]:
+        position = 0
+        for k in TRIANGLE_COLUMNS:
+            iid = self.tree_rows[k]
             if results[k]:
-                self.tree.insert("", "end", values=(f"{k} = {results[k]:.2f}"))
+                self.tree.item(iid, values=(f"{k} = {results[k]:.2f}",))
+                self.tree.move(iid, "", position)
+                position += 1
+            else:
+                self.tree.detach(iid)
 
         self.draw_triangle(results)
 
+    def calculate(self):
+        if self._pending is not None:
+            self.root.after_cancel(self._pending)
+            self._pending = None
+        try:
+            key = self.read_inputs()
+            if classify_triangle(dict(zip(TRIANGLE_COLUMNS, key))) is None:
+                messagebox.showerror("Error", "Enter three values including at least one side, "
+                                              "or two angles!")
+                return
+            results, steps = solve_triangle_cached(key)
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
+        self.status.configure(text="")
+        self.show(key, results, steps)
+
+    def play_inputs(self, frames, interval_ms=5):
+        """
+        Feed a scripted stream of inputs through the entries, one frame every
+        interval_ms, as if typed. Each frame is a dict of entry key -> text.
+        Runs from the event loop, so the window keeps responding throughout.
+        """
+        frames = iter(frames)
+
+        def next_frame():
+            frame = next(frames, None)
+            if frame is None:
+                return
+            for k, text in frame.items():
+                self.entries[k].delete(0, tk.END)
+                self.entries[k].insert(0, text)
+            self.schedule_update()
+            self.root.after(interval_ms, next_frame)
+
+        next_frame()
+
     def clear(self):
+        if self._pending is not None:
+            self.root.after_cancel(self._pending)
+            self._pending = None
+        self._shown_key = None
         for e in self.entries.values():
             e.delete(0, tk.END)
         self.text_output.delete("1.0", tk.END)
-        for i in self.tree.get_children():
-            self.tree.delete(i)
-        self.canvas.delete("all")
-        self.canvas.create_text(200, 200, text="Triangle will display here", fill="black")
-
-
-if __name__ == "__main__":
+        for iid in self.tree_rows.values():
+            self.tree.detach(iid)
+        self.status.configure(text="")
+        self.canvas.itemconfigure("all", state="hidden")
+        self.canvas.itemconfigure(self.placeholder, state="normal")
+
+
+def main(args=None):
+    """
+    Handle 'python trig_triangle_helper.py [--batch in out [--steps]] [--profile]';
+    without --batch the Tk window is opened.
+    """
+    args = sys.argv[1:] if args is None else args
+    if args and args[0] == "--batch":
+        return batch_main(args[1:])
+    if tk is None:
+        print("tkinter is not available; use --batch for headless solving.")
+        return 1
     root = tk.Tk()
     app = TriangleApp(root)
     root.mainloop()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(instrumentation.run_main(main))